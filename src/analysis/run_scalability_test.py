@@ -4,13 +4,17 @@ Cross-Chain Auction Scalability Test Runner
 Evaluate the performance of cross-chain auctions with varying numbers of CBCs (Cross-Chain Bidders).
 This script runs a scalability test for cross-chain auctions, allowing users to specify the number of trials and CBC counts.
 How to use:
-python run_scalability_test.py [--trials N] [--cbc-counts 5,10,20,50]
+python run_scalability_test.py [--trials N] [--cbc-counts 5,10,20,50] [--workers N [--parallel-trials]]
 """
 
 import argparse
+import csv
+import os
+import random
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from scalability_auction_test import run_scalability_test, display_summary_results
-from time import perf_counter
 
 
 def parse_arguments():
@@ -23,6 +27,8 @@ Examples:
   python run_scalability_test.py --trials 20
   python run_scalability_test.py --cbc-counts 5,10,15,20
   python run_scalability_test.py --trials 10 --cbc-counts 5,10,20,50,100
+  python run_scalability_test.py --workers 4
+  python run_scalability_test.py --workers 4 --parallel-trials
         """
     )
 
@@ -40,13 +46,59 @@ Examples:
         help='Comma-separated list of CBC counts to test (default: 5,10,20,50)'
     )
 
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=0,
+        help='Worker processes for the DLP CBC rounds (default: 0, sequential)'
+    )
+
+    parser.add_argument(
+        '--parallel-trials', '-p',
+        action='store_true',
+        help='Use the workers to run whole trials in parallel instead of CBC rounds'
+    )
+
     parser.add_argument(
         '--verbose', '-v',
         action='store_true',
         help='Enable verbose output during testing'
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.parallel_trials and args.workers <= 0:
+        parser.error("--parallel-trials requires --workers N (N > 0)")
+    return args
+
+
+def open_results_files(stem):
+    """Create stem.txt and stem.csv (line-buffered) without overwriting
+
+    The file names only have second resolution, so if either file already
+    exists (e.g. two runs started in the same second) a numeric suffix is
+    added to the stem: stem_1, stem_2, ...
+
+    Returns:
+        (text file, csv file, stem actually used)
+    """
+    candidate = stem
+    suffix = 0
+    while True:
+        try:
+            f = open(f"{candidate}.txt", 'x', buffering=1)
+        except FileExistsError:
+            pass
+        else:
+            try:
+                csv_f = open(f"{candidate}.csv", 'x', newline='', buffering=1)
+            except FileExistsError:
+                # Only the csv name is taken; drop the empty txt just created
+                f.close()
+                os.remove(f"{candidate}.txt")
+            else:
+                return f, csv_f, candidate
+        suffix += 1
+        candidate = f"{stem}_{suffix}"
 
 
 def main():
@@ -69,6 +121,10 @@ def main():
         print("Error: All CBC counts must be positive")
         sys.exit(1)
 
+    if args.workers < 0:
+        print("Error: Number of workers must not be negative")
+        sys.exit(1)
+
     # Display configuration
     print("="*80)
     print("CROSS-CHAIN AUCTION SCALABILITY TEST")
@@ -76,6 +132,10 @@ def main():
     print(f"Configuration:")
     print(f"  CBC counts to test: {cbc_counts}")
     print(f"  Trials per configuration: {args.trials}")
+    if args.parallel_trials:
+        print(f"  Trial workers: {args.workers}")
+    else:
+        print(f"  DLP CBC-round workers: {args.workers or 'Sequential'}")
     print(f"  Verbose output: {'Enabled' if args.verbose else 'Disabled'}")
     print(f"  Auction types: Simple Auction vs DLP-based Auction")
     print()
@@ -85,16 +145,52 @@ def main():
     print(f"Estimated total runtime: ~{estimated_time:.1f} seconds")
     print("\nStarting test...\n")
 
+    # Open the results file up front so each configuration is saved as soon
+    # as it finishes (line-buffered, so a crash keeps the completed rows)
+    now = time.localtime()
+    timestamp = time.strftime("%Y%m%d_%H%M%S", now)
+    f, csv_f, stem = open_results_files(f"scalability_test_results_{timestamp}")
+    results_file = f"{stem}.txt"
+    csv_file = f"{stem}.csv"
+    csv_writer = csv.writer(csv_f)
+    csv_writer.writerow(
+        ['CBC Count', 'Total Bidders', 'Simple Avg (ms)', 'DLP Avg (ms)', 'Ratio'])
+    f.write(f"Cross-Chain Auction Scalability Test Results\n")
+    f.write(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S', now)}\n")
+    f.write(
+        f"Configuration: CBC counts {cbc_counts}, {args.trials} trials each\n\n")
+
+    f.write(
+        f"{'CBC Count':<10} {'Total Bidders':<15} {'Simple Avg (ms)':<15} {'DLP Avg (ms)':<15} {'Ratio':<10}\n")
+    f.write("-" * 80 + "\n")
+
+    def write_result_row(num_cbcs, data):
+        simple_ms = data['avg_simple'] * 1000
+        dlp_ms = data['avg_dlp'] * 1000
+        ratio = data['avg_dlp'] / data['avg_simple']
+        f.write(
+            f"{num_cbcs:<10} {data['total_bidders']:<15} {simple_ms:<15.3f} {dlp_ms:<15.3f} {ratio:<10.2f}x\n")
+        csv_writer.writerow([num_cbcs, data['total_bidders'],
+                             f"{simple_ms:.3f}", f"{dlp_ms:.3f}", f"{ratio:.2f}"])
+
+    # Worker processes are reseeded so they do not share the parent's RNG state
+    executor = None
+    if args.workers > 0:
+        executor = ProcessPoolExecutor(
+            max_workers=args.workers, initializer=random.seed)
+
     # Run the scalability test
-    start_time = perf_counter()
+    start_ns = time.monotonic_ns()
 
     try:
-        results = run_scalability_test(cbc_counts, args.trials)
+        results = run_scalability_test(
+            cbc_counts, args.trials, report_fn=write_result_row,
+            executor=executor, parallel_trials=args.parallel_trials)
 
         # Display comprehensive results
         display_summary_results(results)
 
-        total_time = perf_counter() - start_time
+        total_time = (time.monotonic_ns() - start_ns) / 1e9
 
         print(f"\n{'='*80}")
         print(f"TEST COMPLETED SUCCESSFULLY")
@@ -105,28 +201,8 @@ def main():
         print(
             f"Average time per trial: {total_time/(len(cbc_counts)*args.trials):.4f} seconds")
 
-        # Save results to file
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        results_file = f"scalability_test_results_{timestamp}.txt"
-
-        with open(results_file, 'w') as f:
-            f.write(f"Cross-Chain Auction Scalability Test Results\n")
-            f.write(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(
-                f"Configuration: CBC counts {cbc_counts}, {args.trials} trials each\n\n")
-
-            f.write(
-                f"{'CBC Count':<10} {'Total Bidders':<15} {'Simple Avg (ms)':<15} {'DLP Avg (ms)':<15} {'Ratio':<10}\n")
-            f.write("-" * 80 + "\n")
-
-            for num_cbcs, data in results.items():
-                simple_ms = data['avg_simple'] * 1000
-                dlp_ms = data['avg_dlp'] * 1000
-                ratio = data['avg_dlp'] / data['avg_simple']
-                f.write(
-                    f"{num_cbcs:<10} {data['total_bidders']:<15} {simple_ms:<15.3f} {dlp_ms:<15.3f} {ratio:<10.2f}x\n")
-
         print(f"\nDetailed results saved to: {results_file}")
+        print(f"CSV results saved to: {csv_file}")
 
     except KeyboardInterrupt:
         print("\n\nTest interrupted by user")
@@ -134,8 +210,12 @@ def main():
     except Exception as e:
         print(f"\nError during test execution: {e}")
         sys.exit(1)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        f.close()
+        csv_f.close()
 
 
 if __name__ == "__main__":
-    import time  # Add this import for timestamp
     main()
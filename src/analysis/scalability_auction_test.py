@@ -1,67 +1,62 @@
 import random
+import sys
 import time
 from time import perf_counter
-from typing import List
+from typing import List, NamedTuple, Tuple
 import math
-from sympy import randprime
+from heapq import nlargest
+from functools import lru_cache
+from itertools import chain, repeat
+from operator import attrgetter, itemgetter
+from pathlib import Path
 
+# propose_auction lives one directory up (src/)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-# --- RSA-style Key Generation ---
-def generate_keys(bit_length=16):
-    """Generate RSA-style public and private key pairs"""
-    lower = 2**(bit_length // 2 - 1)
-    upper = 2**(bit_length // 2) - 1
-    p = randprime(lower, upper)
-    q = p
-    while q == p:
-        q = randprime(lower, upper)
-    n = p * q
-    phi = (p-1)*(q-1)
-    e = 65537  # Common public exponent
-    # Ensure e and phi are coprime
-    while phi % e == 0:
-        e = randprime(3, 1000)
-    # Calculate secret exponent d
-    d = pow(e, -1, phi)
-    return (e, n), (d, n)
-
-
-def encrypt(m, pubkey):
-    """Encrypt message m using public key"""
-    e, n = pubkey
-    return pow(m, e, n)
-
-
-def decrypt(c, privkey):
-    """Decrypt ciphertext c using private key"""
-    d, n = privkey
-    return pow(c, d, n)
-
-
-def vc_keygen(k, q):
-    """Generate g for vector commitment"""
-    return 2
+from propose_auction import (generate_keys, generate_keys_crt, _get_keys,
+                             encrypt, decrypt, decrypt_crt, vc_keygen, _pair_bid)
 
 
 # --- Simple Auction Classes (ordinal_auction.py based) ---
 class Bidder:
+    __slots__ = ('id', 'bid_value')
+
     def __init__(self, bidder_id: str, bid_value: int):
         self.id = bidder_id
         self.bid_value = bid_value
 
 
 class ChildBlockchain:
-    def __init__(self, id: str, bidders: List[Bidder], M: int):
+    def __init__(self, id: str, bidder_ids: List[str], bids: List[int], M: int):
+        # Bidders are held as parallel id/bid lists; Bidder objects are only
+        # built for the selected winners (or on demand via .bidders).
+        # If bidder_ids is None, ids are formatted lazily as "<id>_Bidder<k>"
         self.id = id
-        self.bidders = bidders
+        self.bidder_ids = bidder_ids
+        self.bids = bids
         self.M = M
         self.top_bidders = []
 
+    @property
+    def bidders(self) -> Tuple[Bidder, ...]:
+        """Bidder objects for every bidder in this CBC
+
+        Read-only: the tuple is rebuilt from bidder_ids/bids on every access,
+        so add or change bidders through those lists instead.
+        """
+        return tuple(Bidder(self.bidder_id(i), bid) for i, bid in enumerate(self.bids))
+
+    def bidder_id(self, i: int) -> str:
+        """Id of the i-th bidder (0-based) in this CBC"""
+        if self.bidder_ids is None:
+            return f"{self.id}_Bidder{i + 1}"
+        return self.bidder_ids[i]
+
     def select_top_M(self) -> List[Bidder]:
         """各CBCで入札額が高額な上位M名のユーザを決定"""
-        sorted_bidders = sorted(
-            self.bidders, key=lambda x: x.bid_value, reverse=True)
-        self.top_bidders = sorted_bidders[:self.M]
+        bids = self.bids
+        top = nlargest(self.M, range(len(bids)), key=bids.__getitem__)
+        self.top_bidders = [Bidder(self.bidder_id(i), bids[i]) for i in top]
         return self.top_bidders
 
 
@@ -73,19 +68,34 @@ class ParentBlockchain:
 
     def collect_winners(self) -> None:
         """Aggregate the M top winner from each CBC"""
-        for child in self.child_chains:
-            winners = child.select_top_M()
-            self.all_winners.extend(winners)
+        # One extend over all CBCs; a selection already made (e.g. for
+        # display) is reused
+        self.all_winners.extend(chain.from_iterable(
+            child.top_bidders or child.select_top_M()
+            for child in self.child_chains))
 
     def determine_global_winners(self) -> List[Bidder]:
         """Detemine the M top winner in PBC"""
-        sorted_winners = sorted(
-            self.all_winners, key=lambda x: x.bid_value, reverse=True)
-        return sorted_winners[:self.M]
+        return nlargest(self.M, self.all_winners, key=attrgetter('bid_value'))
 
 
 # --- DLP-based Auction Classes (propose_auction.py based) ---
+# Bids are capped at this value, so g^bid mod p can be tabulated up front
+_MAX_SAFE_BID = 1000
+
+
+@lru_cache(maxsize=None)
+def _commitment_table(g, modulus):
+    """Return [g^0, g^1, ..., g^_MAX_SAFE_BID] mod modulus"""
+    table = [1] * (_MAX_SAFE_BID + 1)
+    for i in range(1, _MAX_SAFE_BID + 1):
+        table[i] = table[i - 1] * g % modulus
+    return table
+
+
 class User:
+    __slots__ = ('user_id', 'bid_value', 'commitment', 'encrypted_commitment')
+
     def __init__(self, user_id, bid_value):
         self.user_id = user_id
         self.bid_value = bid_value
@@ -97,14 +107,29 @@ class User:
         if modulus is None:
             modulus = 2**31 - 1
 
-        max_safe_bid = 1000
-        if self.bid_value > max_safe_bid:
+        max_safe_bid = _MAX_SAFE_BID
+        if not 0 <= self.bid_value <= max_safe_bid:
             raise ValueError(
                 f"Bid value {self.bid_value} exceeds safe range {max_safe_bid}")
 
-        self.commitment = pow(g, self.bid_value, modulus)
+        self.commitment = _commitment_table(g, modulus)[self.bid_value]
         return self.commitment
 
+    @classmethod
+    def create_commitments_batch(cls, users, g, modulus=None):
+        """Create commitments for several users sharing the same g and p"""
+        if modulus is None:
+            modulus = 2**31 - 1
+
+        max_safe_bid = _MAX_SAFE_BID
+        table = _commitment_table(g, modulus)
+        for user in users:
+            if not 0 <= user.bid_value <= max_safe_bid:
+                raise ValueError(
+                    f"Bid value {user.bid_value} exceeds safe range {max_safe_bid}")
+            user.commitment = table[user.bid_value]
+        return [user.commitment for user in users]
+
     def encrypt_commitment(self, pubkey):
         """Encrypt commitment using verifier's public key"""
         if self.commitment is None:
@@ -116,7 +141,11 @@ class User:
 class CBCVerifier:
     def __init__(self, cbc_id):
         self.cbc_id = cbc_id
-        self.pubkey, self.privkey = generate_keys()
+        self.pubkey, self.privkey, self.crt_key = _get_keys()
+        self.reset()
+
+    def reset(self):
+        """Clear per-auction state, keeping the keys for the next auction"""
         self.users = []
         self.decrypted_commitments = []
         self.top_M_winners = []
@@ -127,32 +156,33 @@ class CBCVerifier:
 
     def decrypt_commitments(self):
         """Decrypt all received encrypted commitments"""
-        self.decrypted_commitments = []
-        for user in self.users:
-            if user.encrypted_commitment is not None:
-                decrypted = decrypt(user.encrypted_commitment, self.privkey)
-                self.decrypted_commitments.append((user, decrypted))
+        # Built in one pass; the (user, commitment) pairs are then reused as-is
+        # by select_top_M and encrypt_winners_for_pbc
+        crt_key = self.crt_key
+        self.decrypted_commitments = [
+            (user, decrypt_crt(user.encrypted_commitment, crt_key))
+            for user in self.users if user.encrypted_commitment is not None]
         return self.decrypted_commitments
 
     def select_top_M(self, M):
-        """Select top M users based on commitment values"""
-        sorted_commitments = sorted(self.decrypted_commitments,
-                                    key=lambda x: x[1], reverse=True)
-        self.top_M_winners = sorted_commitments[:M]
+        """Select top M users by bid value"""
+        self.top_M_winners = nlargest(
+            M, self.decrypted_commitments, key=_pair_bid)
         return self.top_M_winners
 
     def encrypt_winners_for_pbc(self, pbc_pubkey):
         """Encrypt top M winners' commitments for PBC"""
-        encrypted_winners = []
-        for user, commitment in self.top_M_winners:
-            encrypted = encrypt(commitment, pbc_pubkey)
-            encrypted_winners.append((user, encrypted))
-        return encrypted_winners
+        return [(user, encrypt(commitment, pbc_pubkey))
+                for user, commitment in self.top_M_winners]
 
 
 class PBCVerifier:
     def __init__(self):
-        self.pubkey, self.privkey = generate_keys()
+        self.pubkey, self.privkey, self.crt_key = _get_keys()
+        self.reset()
+
+    def reset(self):
+        """Clear per-auction state, keeping the keys for the next auction"""
         self.all_encrypted_winners = []
         self.all_decrypted_commitments = []
         self.final_winners = []
@@ -165,22 +195,21 @@ class PBCVerifier:
 
     def decrypt_all_commitments(self):
         """Decrypt all commitment values from CBCs"""
-        self.all_decrypted_commitments = []
-        for user, encrypted_commitment in self.all_encrypted_winners:
-            decrypted = decrypt(encrypted_commitment, self.privkey)
-            self.all_decrypted_commitments.append((user, decrypted))
+        crt_key = self.crt_key
+        self.all_decrypted_commitments = [
+            (user, decrypt_crt(encrypted_commitment, crt_key))
+            for user, encrypted_commitment in self.all_encrypted_winners]
         return self.all_decrypted_commitments
 
     def select_final_winners(self, M):
         """Select top M winners globally"""
-        sorted_commitments = sorted(
-            self.all_decrypted_commitments, key=lambda x: x[1], reverse=True)
-        self.final_winners = sorted_commitments[:M]
+        self.final_winners = nlargest(
+            M, self.all_decrypted_commitments, key=_pair_bid)
         return self.final_winners
 
     def generate_random_values(self, M):
         """Generate random values for vector commitment"""
-        self.random_values = [random.randint(1, 100) for _ in range(M)]
+        self.random_values = random.choices(range(1, 101), k=M)
         return self.random_values
 
     def compute_vector_commitment(self, p):
@@ -188,39 +217,67 @@ class PBCVerifier:
         if not self.final_winners or not self.random_values:
             raise ValueError("Final winners or random values not set")
 
-        self.vector_commitment = 1
-        for i, (user, commitment) in enumerate(self.final_winners):
-            r_i = self.random_values[i]
-            self.vector_commitment = (
-                self.vector_commitment * pow(commitment, r_i)) % p
+        # Reduce every power mod p so intermediates never exceed p^2
+        vector_commitment = 1
+        for (user, commitment), r_i in zip(self.final_winners, self.random_values):
+            vector_commitment = vector_commitment * pow(commitment, r_i, p) % p
 
+        self.vector_commitment = vector_commitment
         return self.vector_commitment
 
 
 # --- Bidder Generation Functions ---
+_BID_RANGE = range(50, 301)  # $50-$300 range
+
+
+def draw_bids(bidder_counts: List[int]) -> List[List[int]]:
+    """Draw the bids of every CBC in one call and split them per CBC"""
+    all_bids = random.choices(_BID_RANGE, k=sum(bidder_counts))
+    per_cbc = []
+    start = 0
+    for count in bidder_counts:
+        per_cbc.append(all_bids[start:start + count])
+        start += count
+    return per_cbc
+
+
+def generate_random_bids_simple(chain_id: str, n: int,
+                                bids: List[int] = None) -> Tuple[List[str], List[int]]:
+    """Generate random bidders for Simple Auction as parallel id/bid lists
+
+    If bids is given (e.g. from draw_bids), it is used instead of new draws.
+    """
+    bidder_ids = [f"{chain_id}_Bidder{i}" for i in range(1, n + 1)]
+    if bids is None:
+        bids = random.choices(_BID_RANGE, k=n)
+    return bidder_ids, bids
+
+
 def generate_random_bidders_simple(chain_id: str, n: int) -> List[Bidder]:
     """Generate random bidders for Simple Auction"""
-    bidders = []
-    for i in range(1, n + 1):
-        bidder_id = f"{chain_id}_Bidder{i}"
-        bid_value = random.randint(50, 300)  # $50-$300 range
-        bidders.append(Bidder(bidder_id, bid_value))
-    return bidders
+    bidder_ids, bids = generate_random_bids_simple(chain_id, n)
+    return [Bidder(bidder_id, bid) for bidder_id, bid in zip(bidder_ids, bids)]
 
 
-def generate_random_users_dlp(chain_id: str, n: int) -> List[User]:
-    """Generate random users for DLP Auction"""
-    users = []
-    for i in range(1, n + 1):
-        user_id = f"{chain_id}_User{i}"
-        bid_value = random.randint(50, 300)  # $50-$300 range
-        users.append(User(user_id, bid_value))
-    return users
+def generate_random_users_dlp(chain_id: str, n: int,
+                              bids: List[int] = None) -> List[User]:
+    """Generate random users for DLP Auction
+
+    If bids is given (e.g. from draw_bids), it is used instead of new draws.
+    """
+    if bids is None:
+        bids = random.choices(_BID_RANGE, k=n)
+    return [User(f"{chain_id}_User{i}", bid_value)
+            for i, bid_value in enumerate(bids, 1)]
 
 
 # --- Bidder Distribution Calculator ---
-def calculate_bidder_distribution(num_cbcs: int, total_bidders: int) -> List[int]:
-    """Calculate bidder distribution across CBCs"""
+@lru_cache(maxsize=128)
+def calculate_bidder_distribution(num_cbcs: int, total_bidders: int) -> Tuple[int, ...]:
+    """Calculate bidder distribution across CBCs
+
+    The result is cached, so it is returned as a tuple to keep it immutable.
+    """
     base_count = total_bidders // num_cbcs
     remainder = total_bidders % num_cbcs
 
@@ -228,7 +285,7 @@ def calculate_bidder_distribution(num_cbcs: int, total_bidders: int) -> List[int
     for i in range(remainder):
         distribution[i] += 1
 
-    return distribution
+    return tuple(distribution)
 
 
 # --- Simple Auction Implementation ---
@@ -239,15 +296,13 @@ def run_simple_auction(num_cbcs: int, bidder_counts: List[int], M: int, silent=T
         print(f"Total bidders: {sum(bidder_counts)}")
         print(f"Bidder distribution: {bidder_counts}")
 
-    # Create Child Blockchains
+    # Create Child Blockchains (all bids of the run are drawn at once; bidder
+    # ids are only formatted for the winners)
+    cbc_bids = draw_bids(bidder_counts)
     child_blockchains = []
     for i in range(num_cbcs):
         chain_id = f"CBC{chr(65 + i % 26)}{i // 26 + 1 if i >= 26 else ''}"
-        bidder_count = bidder_counts[i]
-
-        # Generate random bidders
-        bidders = generate_random_bidders_simple(chain_id, bidder_count)
-        cbc = ChildBlockchain(chain_id, bidders, M)
+        cbc = ChildBlockchain(chain_id, None, cbc_bids[i], M)
         child_blockchains.append(cbc)
 
     # Parent Blockchain processing
@@ -263,15 +318,44 @@ def run_simple_auction(num_cbcs: int, bidder_counts: List[int], M: int, silent=T
     return final_winners
 
 
+def _simple_auction_fast(bidder_counts: List[int], M: int) -> List[int]:
+    """Simple Auction on bid values only; returns the final top M bids
+
+    Same selection as run_simple_auction without the ChildBlockchain and
+    Bidder objects, used for timing where the winners are never read.
+    """
+    cbc_winners = chain.from_iterable(
+        nlargest(M, bids) for bids in draw_bids(bidder_counts))
+    return nlargest(M, cbc_winners)
+
+
 # --- DLP Auction Implementation ---
-def run_dlp_auction(num_cbcs: int, bidder_counts: List[int], M: int, silent=True):
-    """Run DLP-based Auction with specified CBC count"""
-    if not silent:
-        print(f"=== DLP Auction: {num_cbcs} CBCs ===")
-        print(f"Total bidders: {sum(bidder_counts)}")
-        print(f"Bidder distribution: {bidder_counts}")
+def _process_cbc(cbc_verifier, bids, g, modulus, pbc_pubkey, M):
+    """Run one CBC's bidding round and return its winners encrypted for the PBC"""
+    users = generate_random_users_dlp(cbc_verifier.cbc_id, len(bids), bids)
 
-    # Setup phase
+    # Register users and process commitments
+    User.create_commitments_batch(users, g, modulus)
+    for user in users:
+        cbc_verifier.register_user(user)
+        user.encrypt_commitment(cbc_verifier.pubkey)
+
+    # CBC processing
+    cbc_verifier.decrypt_commitments()
+    cbc_verifier.select_top_M(M)
+    return cbc_verifier.encrypt_winners_for_pbc(pbc_pubkey)
+
+
+class AuctionContext(NamedTuple):
+    """DLP auction setup that can be shared by repeated auctions"""
+    g: int
+    modulus: int
+    pbc_verifier: PBCVerifier
+    cbc_verifiers: List[CBCVerifier]
+
+
+def make_auction_context(num_cbcs: int) -> AuctionContext:
+    """Run the DLP auction setup phase (generator, modulus, verifiers)"""
     g = vc_keygen(1, 100)
     large_prime = 2**31 - 1
     pbc_verifier = PBCVerifier()
@@ -283,23 +367,40 @@ def run_dlp_auction(num_cbcs: int, bidder_counts: List[int], M: int, silent=True
         cbc_verifier = CBCVerifier(cbc_id)
         cbc_verifiers.append(cbc_verifier)
 
-    # CBC Round
-    for i, cbc_verifier in enumerate(cbc_verifiers):
-        bidder_count = bidder_counts[i]
-        users = generate_random_users_dlp(cbc_verifier.cbc_id, bidder_count)
+    return AuctionContext(g, large_prime, pbc_verifier, cbc_verifiers)
 
-        # Register users and process commitments
-        for user in users:
-            cbc_verifier.register_user(user)
-            commitment = user.create_commitment(g, large_prime)
-            encrypted = user.encrypt_commitment(cbc_verifier.pubkey)
 
-        # CBC processing
-        cbc_verifier.decrypt_commitments()
-        top_winners = cbc_verifier.select_top_M(M)
-        encrypted_winners = cbc_verifier.encrypt_winners_for_pbc(
-            pbc_verifier.pubkey)
-        pbc_verifier.collect_encrypted_winners(encrypted_winners)
+def run_dlp_auction(num_cbcs: int, bidder_counts: List[int], M: int, silent=True,
+                    executor=None, context=None):
+    """Run DLP-based Auction with specified CBC count
+
+    CBCs are independent until the PBC round, so if an executor (e.g. a
+    concurrent.futures.ProcessPoolExecutor) is given, the CBC rounds are
+    distributed over it; otherwise they run sequentially.
+
+    If context (from make_auction_context) is given, its generator and
+    verifiers are reused (after a reset) instead of running the setup phase.
+    """
+    if not silent:
+        print(f"=== DLP Auction: {num_cbcs} CBCs ===")
+        print(f"Total bidders: {sum(bidder_counts)}")
+        print(f"Bidder distribution: {bidder_counts}")
+
+    # Setup phase
+    if context is None:
+        context = make_auction_context(num_cbcs)
+    else:
+        context.pbc_verifier.reset()
+        for cbc_verifier in context.cbc_verifiers:
+            cbc_verifier.reset()
+    g, large_prime, pbc_verifier, cbc_verifiers = context
+
+    # CBC Round
+    map_fn = map if executor is None else executor.map
+    pbc_verifier.collect_encrypted_winners(chain.from_iterable(
+        map_fn(_process_cbc, cbc_verifiers, draw_bids(bidder_counts),
+               repeat(g), repeat(large_prime),
+               repeat(pbc_verifier.pubkey), repeat(M))))
 
     # PBC Round
     pbc_verifier.decrypt_all_commitments()
@@ -317,8 +418,33 @@ def run_dlp_auction(num_cbcs: int, bidder_counts: List[int], M: int, silent=True
 
 
 # --- Performance Testing Functions ---
-def run_scalability_test(cbc_counts: List[int], n_trials: int = 10):
-    """Run scalability test for different CBC counts"""
+def _run_trial(num_cbcs, bidder_distribution, M, executor=None):
+    """Time one Simple and one DLP auction and return (simple_time, dlp_time)"""
+    # Test Simple Auction (winners are discarded, so skip the object layer)
+    start_time = perf_counter()
+    _simple_auction_fast(bidder_distribution, M)
+    simple_time = perf_counter() - start_time
+
+    # Test DLP Auction
+    start_time = perf_counter()
+    run_dlp_auction(num_cbcs, bidder_distribution, M, silent=True,
+                    executor=executor)
+    dlp_time = perf_counter() - start_time
+
+    return simple_time, dlp_time
+
+
+def run_scalability_test(cbc_counts: List[int], n_trials: int = 10, report_fn=None,
+                         executor=None, parallel_trials=False):
+    """Run scalability test for different CBC counts
+
+    If report_fn is given, it is called as report_fn(num_cbcs, result) as
+    soon as each configuration finishes. executor is passed on to
+    run_dlp_auction to run the CBC rounds in parallel, or, with
+    parallel_trials=True, runs whole trials in parallel instead (each trial
+    is still timed inside a single worker, so per-trial times stay
+    comparable as long as there are no more workers than cores).
+    """
     M = 2  # Winners per CBC
     base_total_bidders = 50  # Base number of total bidders
 
@@ -354,32 +480,35 @@ def run_scalability_test(cbc_counts: List[int], n_trials: int = 10):
         simple_times = []
         dlp_times = []
 
-        for trial in range(n_trials):
-            print(f"Trial {trial + 1}/{n_trials}:", end=" ")
+        if parallel_trials and executor is not None:
+            trial_times = executor.map(
+                _run_trial, repeat(num_cbcs, n_trials),
+                repeat(bidder_distribution), repeat(M))
+        else:
+            trial_times = (_run_trial(num_cbcs, bidder_distribution, M, executor)
+                           for _ in range(n_trials))
 
-            # Test Simple Auction
-            start_time = perf_counter()
-            simple_winners = run_simple_auction(
-                num_cbcs, bidder_distribution, M, silent=True)
-            simple_time = perf_counter() - start_time
-            simple_times.append(simple_time)
+        # Running mean and sum of squared deviations (Welford's method)
+        avg_simple = avg_dlp = 0.0
+        m2_simple = m2_dlp = 0.0
 
-            # Test DLP Auction
-            start_time = perf_counter()
-            dlp_winners, vector_commitment = run_dlp_auction(
-                num_cbcs, bidder_distribution, M, silent=True)
-            dlp_time = perf_counter() - start_time
+        for trial, (simple_time, dlp_time) in enumerate(trial_times):
+            simple_times.append(simple_time)
             dlp_times.append(dlp_time)
+            print(f"Trial {trial + 1}/{n_trials}: "
+                  f"Simple={simple_time:.6f}s, DLP={dlp_time:.6f}s")
 
-            print(f"Simple={simple_time:.6f}s, DLP={dlp_time:.6f}s")
+            count = trial + 1
+            delta = simple_time - avg_simple
+            avg_simple += delta / count
+            m2_simple += delta * (simple_time - avg_simple)
+            delta = dlp_time - avg_dlp
+            avg_dlp += delta / count
+            m2_dlp += delta * (dlp_time - avg_dlp)
 
-        # Calculate statistics
-        avg_simple = sum(simple_times) / len(simple_times)
-        avg_dlp = sum(dlp_times) / len(dlp_times)
-        std_simple = math.sqrt(
-            sum((t - avg_simple)**2 for t in simple_times) / len(simple_times))
-        std_dlp = math.sqrt(
-            sum((t - avg_dlp)**2 for t in dlp_times) / len(dlp_times))
+        # Calculate statistics (population standard deviation)
+        std_simple = math.sqrt(m2_simple / len(simple_times))
+        std_dlp = math.sqrt(m2_dlp / len(dlp_times))
 
         # Store results
         results[num_cbcs] = {
@@ -391,6 +520,8 @@ def run_scalability_test(cbc_counts: List[int], n_trials: int = 10):
             'simple_times': simple_times,
             'dlp_times': dlp_times
         }
+        if report_fn is not None:
+            report_fn(num_cbcs, results[num_cbcs])
 
         # Display results for this configuration
         print(f"\nResults for {num_cbcs} CBCs:")
@@ -472,7 +603,7 @@ def display_summary_results(results):
                 (num_cbcs, data['avg_dlp']/data['avg_simple']))
 
     if optimal_configs:
-        best_config = min(optimal_configs, key=lambda x: x[1])
+        best_config = min(optimal_configs, key=itemgetter(1))
         print(
             f"Optimal configuration: {best_config[0]} CBCs (DLP is {1/best_config[1]:.2f}x faster)")
     else:
@@ -1,10 +1,14 @@
 from typing import List
 import random
+from heapq import nlargest
+from operator import attrgetter
 import time
 from time import perf_counter
 
 
 class Bidder:
+    __slots__ = ('id', 'bid_value')
+
     def __init__(self, bidder_id: str, bid_value: int):
         self.id = bidder_id
         self.bid_value = bid_value
@@ -19,10 +23,9 @@ class ChildBlockchain:
 
     def select_top_M(self) -> List[Bidder]:
         """Determine the top M users with the highest bid amounts in each CBC"""
-        # Sort by bid amount in descending order
-        sorted_bidders = sorted(
-            self.bidders, key=lambda x: x.bid_value, reverse=True)
-        self.top_bidders = sorted_bidders[:self.M]
+        # Take the M highest bids without sorting the whole list
+        self.top_bidders = nlargest(
+            self.M, self.bidders, key=attrgetter('bid_value'))
         return self.top_bidders
 
 
@@ -35,17 +38,14 @@ class ParentBlockchain:
     def collect_winners(self) -> None:
         """Aggregate top M bidders from each CBC"""
         for child in self.child_chains:
-            winners = child.select_top_M()
+            # Reuse the selection if it was already made (e.g. for display)
+            winners = child.top_bidders or child.select_top_M()
             self.all_winners.extend(winners)
 
     def determine_global_winners(self) -> List[Bidder]:
         """Determine the top M users with the highest bid amounts in PBC"""
-        # Sort all winners by bid amount in descending order
-        sorted_winners = sorted(
-            self.all_winners, key=lambda x: x.bid_value, reverse=True)
-        return sorted_winners[:self.M]
-
-        return sorted_winners[:self.M]
+        # Take the M highest bids among all CBC winners
+        return nlargest(self.M, self.all_winners, key=attrgetter('bid_value'))
 
 
 def generate_random_bidders(chain_id: str, n: int) -> List[Bidder]:
@@ -59,13 +59,10 @@ def generate_random_bidders(chain_id: str, n: int) -> List[Bidder]:
     Returns:
         List of Bidder objects for test.py
     """
-    bidders = []
-    for i in range(1, n + 1):
-        bidder_id = f"{chain_id}_Bidder{i}"
-        # Generate random bid values from $50 to $300 (same range as test-verify.py)
-        bid_value = random.randint(50, 300)
-        bidders.append(Bidder(bidder_id, bid_value))
-    return bidders
+    # Generate random bid values from $50 to $300 (same range as test-verify.py)
+    bid_values = random.choices(range(50, 301), k=n)
+    return [Bidder(f"{chain_id}_Bidder{i}", bid_value)
+            for i, bid_value in enumerate(bid_values, 1)]
 
 
 def run_simple_auction(bidder_counts, num_child_blockchains, M, silent=False):
@@ -1,26 +1,75 @@
 import random
-from sympy import randprime
+from bisect import bisect_left
+from heapq import nlargest
+from itertools import repeat
+from math import gcd, isqrt
+try:
+    from gmpy2 import powmod
+except ImportError:  # gmpy2 is optional; fall back to the built-in pow
+    powmod = pow
 
 # --- Key Generation (RSA-style) ---
 
 
-def generate_keys(bit_length=16):
-    """Generate RSA-style public and private key pairs"""
+def _sieve_primes(limit):
+    """Return all primes below limit (sieve of Eratosthenes)"""
+    is_prime = bytearray([1]) * limit
+    is_prime[:2] = b"\x00\x00"
+    for n in range(2, isqrt(limit - 1) + 1):
+        if is_prime[n]:
+            is_prime[n*n::n] = bytes(len(range(n*n, limit, n)))
+    return tuple(n for n in range(limit) if is_prime[n])
+
+
+# Primes below 2^16, enough for RSA-style keys of up to 32 bits
+_SMALL_PRIMES = _sieve_primes(1 << 16)
+
+
+def _random_primes(lower, upper, k=1):
+    """Return k distinct random primes in [lower, upper)"""
+    candidates = _SMALL_PRIMES[bisect_left(_SMALL_PRIMES, lower):
+                               bisect_left(_SMALL_PRIMES, upper)]
+    if len(candidates) < k:
+        raise ValueError(
+            f"Not enough primes in [{lower}, {upper}) for {k} picks")
+    return random.sample(candidates, k)
+
+
+def generate_keys_crt(bit_length=16):
+    """Generate RSA-style key pairs plus the CRT form (p, q, dp, dq, qinv) of d"""
     lower = 2**(bit_length // 2 - 1)
     upper = 2**(bit_length // 2) - 1
-    p = randprime(lower, upper)
-    q = p
-    while q == p:
-        q = randprime(lower, upper)
+    p, q = _random_primes(lower, upper, 2)
     n = p * q
     phi = (p-1)*(q-1)
     e = 65537  # Common public exponent
-    # Ensure e and phi are coprime
-    while phi % e == 0:
-        e = randprime(3, 1000)
+    # Ensure e and phi are coprime; otherwise use the smallest odd e that is
+    if gcd(e, phi) != 1:
+        e = 3
+        while gcd(e, phi) != 1:
+            e += 2
     # Calculate secret exponent d
     d = pow(e, -1, phi)
-    return (e, n), (d, n)
+    crt_key = (p, q, d % (p - 1), d % (q - 1), pow(q, -1, p))
+    return (e, n), (d, n), crt_key
+
+
+def generate_keys(bit_length=16):
+    """Generate RSA-style public and private key pairs"""
+    pubkey, privkey, _ = generate_keys_crt(bit_length)
+    return pubkey, privkey
+
+
+# Generated key pairs, reused once _KEY_POOL_SIZE of them exist
+_KEY_POOL = []
+_KEY_POOL_SIZE = 256
+
+
+def _get_keys():
+    """Return (pubkey, privkey, crt_key) from the pool, generating until it is full"""
+    if len(_KEY_POOL) < _KEY_POOL_SIZE:
+        _KEY_POOL.append(generate_keys_crt())
+    return _KEY_POOL[random.randrange(len(_KEY_POOL))]
 
 
 # --- Encryption ---
@@ -29,7 +78,7 @@ def generate_keys(bit_length=16):
 def encrypt(m, pubkey):
     """Encrypt message m using public key"""
     e, n = pubkey
-    return pow(m, e, n)
+    return int(powmod(m, e, n))
 
 
 # --- Decryption ---
@@ -38,7 +87,16 @@ def encrypt(m, pubkey):
 def decrypt(c, privkey):
     """Decrypt ciphertext c using private key"""
     d, n = privkey
-    return pow(c, d, n)
+    return int(powmod(c, d, n))
+
+
+def decrypt_crt(c, crt_key):
+    """Decrypt ciphertext c using the CRT form of the private key"""
+    p, q, dp, dq, qinv = crt_key
+    m1 = int(powmod(c, dp, p))
+    m2 = int(powmod(c, dq, q))
+    h = qinv * (m1 - m2) % p
+    return m2 + h * q
 
 
 # --- Vector Commitment Key Generation ---
@@ -50,18 +108,36 @@ def vc_keygen(k, q):
     return 2
 
 
+# --- Commitment Table ---
+
+
+def build_commitment_table(g, modulus, max_bid=1000):
+    """Precompute table[v] = g^v mod modulus for every bid v in [0, max_bid]"""
+    # Built incrementally: one modular multiplication per entry
+    table = [1] * (max_bid + 1)
+    for v in range(1, max_bid + 1):
+        table[v] = table[v - 1] * g % modulus
+    return table
+
+
 # --- User Class ---
 
 
 class User:
+    __slots__ = ('user_id', 'bid_value', 'commitment', 'encrypted_commitment')
+
     def __init__(self, user_id, bid_value):
         self.user_id = user_id
         self.bid_value = bid_value
         self.commitment = None
         self.encrypted_commitment = None
 
-    def create_commitment(self, g, modulus=None):
-        """Create commitment c_i = g^{v_i} mod p (using bid value directly as exponent)"""
+    def create_commitment(self, g, modulus=None, table=None):
+        """Create commitment c_i = g^{v_i} mod p (using bid value directly as exponent)
+
+        If table is given (see build_commitment_table), the commitment is
+        looked up instead of computed.
+        """
         # Use bid value directly as exponent for more reasonable computation
         # If modulus is provided, use it; otherwise use a large prime for demonstration
         if modulus is None:
@@ -73,24 +149,56 @@ class User:
             raise ValueError(
                 f"Bid value {self.bid_value} exceeds safe range {max_safe_bid}")
 
-        self.commitment = pow(g, self.bid_value, modulus)
+        if table is not None and 0 <= self.bid_value < len(table):
+            self.commitment = table[self.bid_value]
+        else:
+            self.commitment = int(powmod(g, self.bid_value, modulus))
         return self.commitment
 
-    def encrypt_commitment(self, pubkey):
-        """Encrypt commitment using verifier's public key"""
+    def encrypt_commitment(self, pubkey, in_process_fast_path=False):
+        """Encrypt commitment using verifier's public key
+
+        With in_process_fast_path, the commitment is passed through as-is
+        (for single-process runs where the ciphertext never leaves memory).
+        """
         if self.commitment is None:
             raise ValueError("Commitment not created yet")
-        self.encrypted_commitment = encrypt(self.commitment, pubkey)
+        if in_process_fast_path:
+            self.encrypted_commitment = self.commitment
+        else:
+            self.encrypted_commitment = encrypt(self.commitment, pubkey)
         return self.encrypted_commitment
 
+    @classmethod
+    def encrypt_commitments_batch(cls, users, pubkey):
+        """Encrypt the commitments of several users with the same public key"""
+        e, n = pubkey
+        for user in users:
+            if user.commitment is None:
+                raise ValueError("Commitment not created yet")
+            user.encrypted_commitment = int(powmod(user.commitment, e, n))
+        return [user.encrypted_commitment for user in users]
+
+
+def _pair_bid(pair):
+    """Ranking key for a (user, commitment) pair: the user's bid value"""
+    # g^v mod p is not monotonic in v once it wraps around p, so winners are
+    # ranked by the bid itself rather than by the commitment value
+    return pair[0].bid_value
+
 
 # --- Child Blockchain (CBC) Verifier ---
 
 
 class CBCVerifier:
-    def __init__(self, cbc_id):
+    def __init__(self, cbc_id, keys=None):
         self.cbc_id = cbc_id
-        self.pubkey, self.privkey = generate_keys()
+        # keys: optional (pubkey, privkey, crt_key) from generate_keys_crt
+        self.pubkey, self.privkey, self.crt_key = keys or _get_keys()
+        self.reset()
+
+    def reset(self):
+        """Clear per-auction state, keeping the keys for the next auction"""
         self.users = []
         self.decrypted_commitments = []
         self.top_M_winners = []
@@ -99,25 +207,34 @@ class CBCVerifier:
         """Register a user in this CBC"""
         self.users.append(user)
 
-    def decrypt_commitments(self):
+    def register_users(self, users):
+        """Register several users in this CBC at once"""
+        self.users.extend(users)
+
+    def decrypt_commitments(self, in_process_fast_path=False):
         """Decrypt all received encrypted commitments"""
-        self.decrypted_commitments = []
-        for user in self.users:
-            if user.encrypted_commitment is not None:
-                decrypted = decrypt(user.encrypted_commitment, self.privkey)
-                self.decrypted_commitments.append((user, decrypted))
+        received = [user for user in self.users
+                    if user.encrypted_commitment is not None]
+        if in_process_fast_path:
+            self.decrypted_commitments = [
+                (user, user.encrypted_commitment) for user in received]
+        else:
+            crt_key = self.crt_key
+            self.decrypted_commitments = [
+                (user, decrypt_crt(user.encrypted_commitment, crt_key))
+                for user in received]
         return self.decrypted_commitments
 
     def select_top_M(self, M):
-        """Select top M users based on commitment values"""
-        # Sort by commitment value (larger is better)
-        sorted_commitments = sorted(self.decrypted_commitments,
-                                    key=lambda x: x[1], reverse=True)
-        self.top_M_winners = sorted_commitments[:M]
+        """Select top M users by bid value"""
+        self.top_M_winners = nlargest(
+            M, self.decrypted_commitments, key=_pair_bid)
         return self.top_M_winners
 
-    def encrypt_winners_for_pbc(self, pbc_pubkey):
+    def encrypt_winners_for_pbc(self, pbc_pubkey, in_process_fast_path=False):
         """Encrypt top M winners' commitments for PBC"""
+        if in_process_fast_path:
+            return list(self.top_M_winners)
         encrypted_winners = []
         for user, commitment in self.top_M_winners:
             encrypted = encrypt(commitment, pbc_pubkey)
@@ -129,8 +246,13 @@ class CBCVerifier:
 
 
 class PBCVerifier:
-    def __init__(self):
-        self.pubkey, self.privkey = generate_keys()
+    def __init__(self, keys=None):
+        # keys: optional (pubkey, privkey, crt_key) from generate_keys_crt
+        self.pubkey, self.privkey, self.crt_key = keys or _get_keys()
+        self.reset()
+
+    def reset(self):
+        """Clear per-auction state, keeping the keys for the next auction"""
         self.all_encrypted_winners = []
         self.all_decrypted_commitments = []
         self.final_winners = []
@@ -141,25 +263,26 @@ class PBCVerifier:
         """Collect encrypted winners from all CBCs"""
         self.all_encrypted_winners.extend(cbc_encrypted_winners)
 
-    def decrypt_all_commitments(self):
+    def decrypt_all_commitments(self, in_process_fast_path=False):
         """Decrypt all commitment values from CBCs"""
+        if in_process_fast_path:
+            self.all_decrypted_commitments = list(self.all_encrypted_winners)
+            return self.all_decrypted_commitments
         self.all_decrypted_commitments = []
         for user, encrypted_commitment in self.all_encrypted_winners:
-            decrypted = decrypt(encrypted_commitment, self.privkey)
+            decrypted = decrypt_crt(encrypted_commitment, self.crt_key)
             self.all_decrypted_commitments.append((user, decrypted))
         return self.all_decrypted_commitments
 
     def select_final_winners(self, M):
         """Select top M winners globally"""
-        # Sort by commitment value (larger is better)
-        sorted_commitments = sorted(
-            self.all_decrypted_commitments, key=lambda x: x[1], reverse=True)
-        self.final_winners = sorted_commitments[:M]
+        self.final_winners = nlargest(
+            M, self.all_decrypted_commitments, key=_pair_bid)
         return self.final_winners
 
     def generate_random_values(self, M):
         """Generate random values for vector commitment"""
-        self.random_values = [random.randint(1, 100) for _ in range(M)]
+        self.random_values = random.choices(range(1, 101), k=M)
         return self.random_values
 
     def compute_vector_commitment(self, p):
@@ -167,19 +290,20 @@ class PBCVerifier:
         if not self.final_winners or not self.random_values:
             raise ValueError("Final winners or random values not set")
 
-        self.vector_commitment = 1
-        for i, (user, commitment) in enumerate(self.final_winners):
-            r_i = self.random_values[i]
-            self.vector_commitment = (
-                self.vector_commitment * pow(commitment, r_i)) % p
+        # Reduce every power mod p so intermediates never exceed p^2
+        vector_commitment = 1
+        for (user, commitment), r_i in zip(self.final_winners, self.random_values):
+            vector_commitment = vector_commitment * \
+                int(powmod(commitment, r_i, p)) % p
 
+        self.vector_commitment = vector_commitment
         return self.vector_commitment
 
 
 # --- Commitment Comparison Verification ---
 
 
-def verify_commitment_ordering(g, modulus, max_bid=1000):
+def verify_commitment_ordering(g, modulus, max_bid=1000, verbose=True):
     """
     Verify that g^x mod p maintains monotonic ordering for bid values
 
@@ -187,12 +311,14 @@ def verify_commitment_ordering(g, modulus, max_bid=1000):
         g: generator
         modulus: prime modulus
         max_bid: maximum bid value to test
+        verbose: If False, suppress the progress output
 
     Returns:
         bool: True if ordering is preserved
     """
-    print(
-        f"Verifying commitment ordering for g={g}, p={modulus}, max_bid={max_bid}")
+    if verbose:
+        print(
+            f"Verifying commitment ordering for g={g}, p={modulus}, max_bid={max_bid}")
 
     # Test a sample of bid values
     test_bids = [50, 100, 150, 200, 250, 300]
@@ -202,20 +328,87 @@ def verify_commitment_ordering(g, modulus, max_bid=1000):
         if bid <= max_bid:
             commitment = pow(g, bid, modulus)
             commitments.append((bid, commitment))
-            print(f"  Bid {bid}: commitment = {commitment}")
+            if verbose:
+                print(f"  Bid {bid}: commitment = {commitment}")
 
     # Check if commitments are in ascending order
     is_monotonic = all(commitments[i][1] < commitments[i+1][1]
                        for i in range(len(commitments)-1))
 
-    print(f"  Monotonic ordering preserved: {is_monotonic}")
+    if verbose:
+        print(f"  Monotonic ordering preserved: {is_monotonic}")
     return is_monotonic
 
 
+# --- CBC Round ---
+
+
+def process_cbc(cbc, bids, g, commitment_table, pbc_pubkey, M, silent=False,
+                in_process_fast_path=False):
+    """
+    Run one CBC's round and return its top M winners encrypted for the PBC
+
+    Args:
+        cbc: CBCVerifier of this CBC
+        bids: Bid values of this CBC's users
+        g: Generator for the commitments
+        commitment_table: Table from build_commitment_table
+        pbc_pubkey: PBC public key
+        M: Number of winners to select
+        silent: If True, suppress detailed output
+        in_process_fast_path: See run_auction
+    """
+    if not silent:
+        print(f"\n--- Processing {cbc.cbc_id} ---")
+
+    # Create users for this CBC
+    cbc_id = cbc.cbc_id
+    users = [User(f"{cbc_id}_User_{i}", bid_value)
+             for i, bid_value in enumerate(bids, 1)]
+    cbc.register_users(users)
+
+    # Bidding phase
+    if not silent:
+        print("Bidding phase:")
+    for user in users:
+        # 1. User creates commitment c_i = g^{bin(v_i)}
+        commitment = user.create_commitment(g, table=commitment_table)
+
+        if not silent:
+            print(f"  {user.user_id}: bid={user.bid_value}, "
+                  f"bin(bid)={bin(user.bid_value)[2:]}, "
+                  f"commitment={commitment}")
+
+    # 2. Users encrypt their commitments with the CBC public key
+    if in_process_fast_path:
+        for user in users:
+            user.encrypt_commitment(cbc.pubkey, in_process_fast_path)
+    else:
+        User.encrypt_commitments_batch(users, cbc.pubkey)
+
+    # CBC verifier processes
+    if not silent:
+        print("CBC verifier processing:")
+
+    # 3. Decrypt all commitments
+    cbc.decrypt_commitments(in_process_fast_path)
+
+    # 4. Select top M winners
+    top_winners = cbc.select_top_M(M)
+    if not silent:
+        print(f"  Top {M} winners in {cbc.cbc_id}:")
+        for user, commitment in top_winners:
+            print(f"    {user.user_id}: commitment={commitment}")
+
+    # 5. Encrypt winners for PBC
+    return cbc.encrypt_winners_for_pbc(pbc_pubkey, in_process_fast_path)
+
+
 # --- Main M+1st-price Sealed Bid Auction Protocol ---
 
 
-def run_auction(N_cbcs=3, users_per_cbc=5, M=2):
+def run_auction(N_cbcs=3, users_per_cbc=5, M=2, silent=False,
+                in_process_fast_path=False, executor=None, keys=None):
     """
     Run the complete M+1st-price sealed bid auction
 
@@ -223,106 +416,100 @@ def run_auction(N_cbcs=3, users_per_cbc=5, M=2):
         N_cbcs: Number of Child Blockchains
         users_per_cbc: Number of users per CBC
         M: Number of winners to select
+        silent: If True, suppress detailed output
+        in_process_fast_path: If True, skip the RSA wrap/unwrap of
+            commitments (everything runs in one process, so the
+            ciphertexts are never transmitted)
+        executor: Optional concurrent.futures executor (e.g. a
+            ProcessPoolExecutor) to run the CBC rounds in parallel; best
+            combined with silent=True, as worker output is not ordered
+        keys: Optional list of N_cbcs + 1 (pubkey, privkey, crt_key) triples
+            from generate_keys_crt, the first for the PBC and the rest for
+            the CBCs, so repeated runs can share the same keys
     """
-    print("=" * 60)
-    print("M+1st-price Sealed Bid Auction from N Child Blockchains")
-    print("=" * 60)
+    if not silent:
+        print("=" * 60)
+        print("M+1st-price Sealed Bid Auction from N Child Blockchains")
+        print("=" * 60)
 
-    # Setup Phase
-    print("\n--- Setup Phase ---")
+        # Setup Phase
+        print("\n--- Setup Phase ---")
 
     # 1. PBC generates g
     g = vc_keygen(1, 100)  # k=1, q=100 for demonstration
-    print(f"Generated g: {g}")
+    if not silent:
+        print(f"Generated g: {g}")
+
+    # Commitments g^v mod p for every possible bid, computed once
+    commitment_table = build_commitment_table(g, 2**31 - 1)
 
     # 2. PBC generates random values (will be used later)
-    pbc_verifier = PBCVerifier()
-    print(f"PBC public key: {pbc_verifier.pubkey}")
+    pbc_verifier = PBCVerifier(keys[0] if keys else None)
+    if not silent:
+        print(f"PBC public key: {pbc_verifier.pubkey}")
 
     # 3. Create CBCs and their verifiers
     cbcs = []
     for i in range(N_cbcs):
         cbc_id = f"CBC_{chr(65+i)}"  # CBC_A, CBC_B, CBC_C, ...
-        cbc_verifier = CBCVerifier(cbc_id)
-        print(f"{cbc_id} public key: {cbc_verifier.pubkey}")
+        cbc_verifier = CBCVerifier(cbc_id, keys[i + 1] if keys else None)
+        if not silent:
+            print(f"{cbc_id} public key: {cbc_verifier.pubkey}")
         cbcs.append(cbc_verifier)
 
     # CBC Round
-    print(f"\n--- CBC Round (Processing {N_cbcs} Child Blockchains) ---")
-
-    for cbc_idx, cbc in enumerate(cbcs):
-        print(f"\n--- Processing {cbc.cbc_id} ---")
-
-        # Create users for this CBC
-        users = []
-        for i in range(users_per_cbc):
-            user_id = f"{cbc.cbc_id}_User_{i+1}"
-            bid_value = random.randint(10, 100)  # Random bid between $10-$100
-            user = User(user_id, bid_value)
-            users.append(user)
-            cbc.register_user(user)
-
-        # Bidding phase
-        print("Bidding phase:")
-        for user in users:
-            # 1. User creates commitment c_i = g^{bin(v_i)}
-            commitment = user.create_commitment(g)
-
-            # 2. User encrypts commitment
-            encrypted = user.encrypt_commitment(cbc.pubkey)
-
-            print(f"  {user.user_id}: bid={user.bid_value}, "
-                  f"bin(bid)={bin(user.bid_value)[2:]}, "
-                  f"commitment={commitment}")
-
-        # CBC verifier processes
-        print("CBC verifier processing:")
-
-        # 3. Decrypt all commitments
-        cbc.decrypt_commitments()
-
-        # 4. Select top M winners
-        top_winners = cbc.select_top_M(M)
-        print(f"  Top {M} winners in {cbc.cbc_id}:")
-        for user, commitment in top_winners:
-            print(f"    {user.user_id}: commitment={commitment}")
-
-        # 5. Encrypt winners for PBC
-        encrypted_winners = cbc.encrypt_winners_for_pbc(pbc_verifier.pubkey)
+    if not silent:
+        print(f"\n--- CBC Round (Processing {N_cbcs} Child Blockchains) ---")
+
+    # Draw every user's bid up front (random bid between $10-$100)
+    all_bids = random.choices(range(10, 101), k=N_cbcs * users_per_cbc)
+
+    # Each CBC is independent until the PBC round
+    map_fn = map if executor is None else executor.map
+    cbc_bids = [all_bids[i * users_per_cbc:(i + 1) * users_per_cbc]
+                for i in range(N_cbcs)]
+    for encrypted_winners in map_fn(
+            process_cbc, cbcs, cbc_bids, repeat(g), repeat(commitment_table),
+            repeat(pbc_verifier.pubkey), repeat(M), repeat(silent),
+            repeat(in_process_fast_path)):
         pbc_verifier.collect_encrypted_winners(encrypted_winners)
 
     # PBC Round
-    print(f"\n--- PBC Round ---")
+    if not silent:
+        print(f"\n--- PBC Round ---")
 
-    # 1. Decrypt all commitments from CBCs
-    print("Decrypting commitments from all CBCs...")
-    pbc_verifier.decrypt_all_commitments()
+        # 1. Decrypt all commitments from CBCs
+        print("Decrypting commitments from all CBCs...")
+    pbc_verifier.decrypt_all_commitments(in_process_fast_path)
 
-    print("All candidates:")
-    for user, commitment in pbc_verifier.all_decrypted_commitments:
-        print(f"  {user.user_id}: commitment={commitment}")
+    if not silent:
+        print("All candidates:")
+        for user, commitment in pbc_verifier.all_decrypted_commitments:
+            print(f"  {user.user_id}: commitment={commitment}")
 
     # 2. Select final top M winners
     final_winners = pbc_verifier.select_final_winners(M)
 
-    print(f"\nFinal Top {M} Winners:")
-    for i, (user, commitment) in enumerate(final_winners):
-        print(
-            f"  {i+1}. {user.user_id}: bid=${user.bid_value}, commitment={commitment}")
+    if not silent:
+        print(f"\nFinal Top {M} Winners:")
+        for i, (user, commitment) in enumerate(final_winners):
+            print(
+                f"  {i+1}. {user.user_id}: bid=${user.bid_value}, commitment={commitment}")
 
     # 3. Generate random values and compute vector commitment
     random_values = pbc_verifier.generate_random_values(M)
     p = pbc_verifier.pubkey[1]  # Use n as substitute for p
     vector_commitment = pbc_verifier.compute_vector_commitment(p)
 
-    print(f"\nVector Commitment:")
-    print(f"  Random values: {random_values}")
-    print(f"  Vector commitment C: {vector_commitment}")
+    if not silent:
+        print(f"\nVector Commitment:")
+        print(f"  Random values: {random_values}")
+        print(f"  Vector commitment C: {vector_commitment}")
 
-    # Verification phase
-    print(f"\n--- Verification Phase ---")
-    print(f"Published auxiliary information: {random_values}")
-    print("All users can now verify the vector commitment...")
+        # Verification phase
+        print(f"\n--- Verification Phase ---")
+        print(f"Published auxiliary information: {random_values}")
+        print("All users can now verify the vector commitment...")
 
     return final_winners, vector_commitment
 
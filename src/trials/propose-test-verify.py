@@ -1,60 +1,64 @@
-import ordinal_auction
+import argparse
 import math
 import sys
-import time
 import random
-import concurrent.futures
-# Use perf_counter for more precise time measurement
-from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+# Use perf_counter_ns for precise (integer nanosecond) time measurement
+from time import perf_counter_ns
 from ordinal_auction import Bidder, ChildBlockchain, ParentBlockchain
 # Import necessary classes and functions from auction.py
-from propose_auction import User, CBCVerifier, PBCVerifier, vc_keygen, verify_commitment_ordering
+from propose_auction import (CBCVerifier, PBCVerifier, vc_keygen, verify_commitment_ordering,
+                             build_commitment_table, process_cbc)
 
 # Increase the limit for large integer string conversion
 sys.set_int_max_str_digits(10000)
 
+# Chain IDs (CBCA, CBCB, ...) are the same in every trial, so build them once
+_CHAIN_IDS = tuple(f"CBC{chr(65 + i)}" for i in range(64))
 
-def generate_random_bidders_for_auction(chain_id: str, n: int) -> list:
+
+def generate_random_bidders(chain_id: str, n: int, rng=random) -> list:
     """
-    Function to generate n random bidders for auction.py
+    Function to generate n random bidders for test.py
 
     Args:
         chain_id: Chain ID (e.g., "CBCA", "CBCB")
         n: Number of bidders to generate
+        rng: random.Random instance to draw the bids from (default: the
+            random module's global generator)
 
     Returns:
-        List of User objects for auction.py
+        List of Bidder objects for test.py
     """
-    bidders = []
-    for i in range(1, n + 1):
-        bidder_id = f"{chain_id}_Bidder{i}"
-        # Generate random bid values from $50 to $300
-        bid_value = random.randint(50, 300)
-        bidders.append(User(bidder_id, bid_value))
-    return bidders
+    # Generate random bid values from $50 to $300 in one call
+    bid_values = rng.choices(range(50, 301), k=n)
+    return [Bidder(f"{chain_id}_Bidder{i}", bid_value)
+            for i, bid_value in enumerate(bid_values, 1)]
 
 
-def generate_random_bidders(chain_id: str, n: int) -> list:
+@lru_cache(maxsize=None)
+def _setup(max_bid):
     """
-    Function to generate n random bidders for test.py
+    PBC setup shared by all trials: generator, modulus and commitment table
 
-    Args:
-        chain_id: Chain ID (e.g., "CBCA", "CBCB")
-        n: Number of bidders to generate
+    g and the modulus do not change between trials, so the table is
+    computed once per max_bid.
 
     Returns:
-        List of Bidder objects for test.py
+        (g, large_prime, commitment_table)
     """
-    bidders = []
-    for i in range(1, n + 1):
-        bidder_id = f"{chain_id}_Bidder{i}"
-        # Generate random bid values from $50 to $300
-        bid_value = random.randint(50, 300)
-        bidders.append(Bidder(bidder_id, bid_value))
-    return bidders
+    g = vc_keygen(1, 100)
+    large_prime = 2**31 - 1  # Mersenne prime
 
+    commitment_table = build_commitment_table(g, large_prime, max_bid)
 
-def run_performance_test(bidder_counts, num_child_blockchains, M, n_trials=5):
+    return g, large_prime, commitment_table
+
+
+def run_performance_test(bidder_counts, num_child_blockchains, M, n_trials=5, executor=None,
+                         rng=random):
     """
     Execute n times and measure average execution time
 
@@ -63,30 +67,49 @@ def run_performance_test(bidder_counts, num_child_blockchains, M, n_trials=5):
         num_child_blockchains: Number of CBCs
         M: Number of winners to select
         n_trials: Number of executions
+        executor: Optional executor for the DLP CBC rounds
+            (see run_auction_with_generated_data)
+        rng: random.Random instance all bids are drawn from (seed it for
+            the same bids on every run)
+
+    The DLP timings exclude the vector commitment (its result is not used
+    here), so the DLP/Simple ratio compares the auction work only.
     """
     print(f"\n{'='*60}")
     print(f"PERFORMANCE TEST ({n_trials} trials)")
     print(f"{'='*60}")
 
+    # Per-trial times in integer nanoseconds (converted to seconds only
+    # for display)
     times_simple = []
     times_dlp = []
 
+    # Setup and the verifier keys are invariant across trials, so they are
+    # done once outside the timing (the verifiers are reset every trial)
+    setup = _setup(300)
+    verifiers = (PBCVerifier(),
+                 [CBCVerifier(cbc_id) for cbc_id in _CHAIN_IDS[:num_child_blockchains]])
+
+    # Running mean and sum of squared deviations in ns (Welford's method)
+    mean_simple_ns = mean_dlp_ns = 0.0
+    m2_simple = m2_dlp = 0.0
+
     for trial in range(1, n_trials + 1):
         print(f"\n--- Trial {trial}/{n_trials} ---")
 
         # Simple auction (test.py) measurement
         print("Testing Simple Auction (test.py)...")
-        start_time = perf_counter()
+        start_time = perf_counter_ns()
 
         # Original auction using test.py
         child_blockchains = []
 
         for i in range(num_child_blockchains):
-            chain_id = f"CBC{chr(65 + i)}"
+            chain_id = _CHAIN_IDS[i]
             bidder_count = bidder_counts[i]
 
             # Generate random bidders
-            bidders = generate_random_bidders(chain_id, bidder_count)
+            bidders = generate_random_bidders(chain_id, bidder_count, rng)
             child_blockchain = ChildBlockchain(chain_id, bidders, M=M)
             child_blockchains.append(child_blockchain)
 
@@ -95,31 +118,37 @@ def run_performance_test(bidder_counts, num_child_blockchains, M, n_trials=5):
         parent.collect_winners()
         global_winners = parent.determine_global_winners()
 
-        simple_time = perf_counter() - start_time
-        times_simple.append(simple_time)
-        print(f"Simple auction time: {simple_time:.6f} seconds")
+        simple_ns = perf_counter_ns() - start_time
+        times_simple.append(simple_ns)
+        print(f"Simple auction time: {simple_ns / 1e9:.6f} seconds")
+
+        delta = simple_ns - mean_simple_ns
+        mean_simple_ns += delta / trial
+        m2_simple += delta * (simple_ns - mean_simple_ns)
 
         # DLP auction (auction.py) measurement
         print("Testing DLP-based Auction (auction.py)...")
-        start_time = perf_counter()
+        start_time = perf_counter_ns()
 
         # Complete DLP-based auction using auction.py (suppress output)
         final_winners, vector_commitment = run_auction_with_generated_data(
-            bidder_counts, num_child_blockchains, M, silent=True
+            bidder_counts, num_child_blockchains, M, silent=True, setup=setup,
+            executor=executor, compute_vc=False, verifiers=verifiers, rng=rng
         )
 
-        dlp_time = perf_counter() - start_time
-        times_dlp.append(dlp_time)
-        print(f"DLP auction time: {dlp_time:.6f} seconds")
+        dlp_ns = perf_counter_ns() - start_time
+        times_dlp.append(dlp_ns)
+        print(f"DLP auction time: {dlp_ns / 1e9:.6f} seconds")
 
-    # Calculate statistics
-    avg_simple = sum(times_simple) / len(times_simple)
-    avg_dlp = sum(times_dlp) / len(times_dlp)
+        delta = dlp_ns - mean_dlp_ns
+        mean_dlp_ns += delta / trial
+        m2_dlp += delta * (dlp_ns - mean_dlp_ns)
 
-    std_simple = math.sqrt(
-        sum((t - avg_simple)**2 for t in times_simple) / len(times_simple))
-    std_dlp = math.sqrt(
-        sum((t - avg_dlp)**2 for t in times_dlp) / len(times_dlp))
+    # Calculate statistics in seconds (population standard deviation)
+    avg_simple = mean_simple_ns / 1e9
+    avg_dlp = mean_dlp_ns / 1e9
+    std_simple = math.sqrt(m2_simple / n_trials) / 1e9
+    std_dlp = math.sqrt(m2_dlp / n_trials) / 1e9
 
     # Display results
     print(f"\n{'='*60}")
@@ -135,12 +164,12 @@ def run_performance_test(bidder_counts, num_child_blockchains, M, n_trials=5):
     print(
         f"  Average time: {avg_simple:.6f} seconds ({avg_simple*1000:.3f} ms)")
     print(f"  Standard deviation: ± {std_simple:.6f} seconds")
-    print(f"  Individual times: {[f'{t:.6f}' for t in times_simple]}")
+    print(f"  Individual times: {[f'{t / 1e9:.6f}' for t in times_simple]}")
 
     print(f"\nDLP-based Auction (auction.py):")
     print(f"  Average time: {avg_dlp:.6f} seconds ({avg_dlp*1000:.3f} ms)")
     print(f"  Standard deviation: ± {std_dlp:.6f} seconds")
-    print(f"  Individual times: {[f'{t:.6f}' for t in times_dlp]}")
+    print(f"  Individual times: {[f'{t / 1e9:.6f}' for t in times_dlp]}")
 
     print(f"\nPerformance Comparison:")
     speedup = avg_dlp / avg_simple if avg_simple > 0 else float('inf')
@@ -151,12 +180,13 @@ def run_performance_test(bidder_counts, num_child_blockchains, M, n_trials=5):
     # Also display minimum and maximum times
     print(f"\nDetailed Statistics:")
     print(
-        f"  Simple Auction - Min: {min(times_simple):.6f}s, Max: {max(times_simple):.6f}s")
+        f"  Simple Auction - Min: {min(times_simple) / 1e9:.6f}s, Max: {max(times_simple) / 1e9:.6f}s")
     print(
-        f"  DLP Auction - Min: {min(times_dlp):.6f}s, Max: {max(times_dlp):.6f}s")
+        f"  DLP Auction - Min: {min(times_dlp) / 1e9:.6f}s, Max: {max(times_dlp) / 1e9:.6f}s")
 
     # Also display total execution time for performance test
-    performance_test_total_time = sum(times_simple) + sum(times_dlp)
+    # (exact integer sum of the ns samples)
+    performance_test_total_time = (sum(times_simple) + sum(times_dlp)) / 1e9
     print(f"\nPerformance Test Summary:")
     print(
         f"  Total test execution time: {performance_test_total_time:.6f} seconds ({performance_test_total_time*1000:.3f} ms)")
@@ -181,7 +211,9 @@ def run_performance_test(bidder_counts, num_child_blockchains, M, n_trials=5):
         f"# - Standard deviation comparison: Simple±{std_simple:.6f}s vs DLP±{std_dlp:.6f}s")
 
 
-def run_auction_with_generated_data(bidder_counts, num_child_blockchains, M, silent=False):
+def run_auction_with_generated_data(bidder_counts, num_child_blockchains, M, silent=False,
+                                    setup=None, executor=None, compute_vc=True,
+                                    verifiers=None, rng=random):
     """
     Execute auction using auction.py code
 
@@ -190,111 +222,79 @@ def run_auction_with_generated_data(bidder_counts, num_child_blockchains, M, sil
         num_child_blockchains: Number of CBCs
         M: Number of winners to select
         silent: If True, suppress detailed output
+        setup: Optional (g, large_prime, commitment_table) from _setup; if
+            given, the Setup Phase is skipped
+        executor: Optional concurrent.futures executor (e.g. a
+            ProcessPoolExecutor) to run the CBC rounds in parallel; best
+            combined with silent=True, as worker output is not ordered
+        compute_vc: If False, skip the vector commitment and return None
+            in its place (for timing runs that do not use it)
+        verifiers: Optional (pbc_verifier, cbc_verifiers) from an earlier run;
+            they are reset and reused instead of creating verifiers with new keys
+        rng: random.Random instance the bids are drawn from
     """
     if not silent:
         print("=" * 60)
         print("M+1st-price Sealed Bid Auction using auction.py")
         print("=" * 60)
 
-    # Setup Phase
-    if not silent:
-        print("\n--- Setup Phase ---")
-
-    # 1. PBC generates g
-    g = vc_keygen(1, 100)
-    if not silent:
-        print(f"Generated g: {g}")
-
-    # Use a large prime as modulus
-    large_prime = 2**31 - 1  # Mersenne prime
-
-    # 2. Verify commitment ordering is preserved
-    if not silent:
-        print("\n--- Verifying Commitment Ordering ---")
-    # Suppress output during silent execution when running verify_commitment_ordering
-    import io
-    import sys
-    if silent:
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
+    if setup is not None:
+        g, large_prime, commitment_table = setup
+    else:
+        # Setup Phase
+        if not silent:
+            print("\n--- Setup Phase ---")
 
-    ordering_preserved = verify_commitment_ordering(g, large_prime, 300)
+        # 1. PBC generates g
+        g = vc_keygen(1, 100)
+        if not silent:
+            print(f"Generated g: {g}")
 
-    if silent:
-        sys.stdout = old_stdout
+        # Use a large prime as modulus
+        large_prime = 2**31 - 1  # Mersenne prime
 
-    if not ordering_preserved:
+        # 2. Check commitment ordering (diagnostic only: winners are ranked
+        # by bid value, so the auction does not depend on it)
         if not silent:
-            print("Warning: Commitment ordering may not be preserved!")
-        return None, None
+            print("\n--- Verifying Commitment Ordering ---")
+            if not verify_commitment_ordering(g, large_prime, 300):
+                print("Note: commitments wrap modulo p; winners are ranked by bid value")
+
+        # Commitments g^v mod p for every possible bid ($50-$300)
+        commitment_table = build_commitment_table(g, large_prime, 300)
+
+    if verifiers is not None:
+        pbc_verifier, cbc_verifiers = verifiers
+        pbc_verifier.reset()
+        for cbc_verifier in cbc_verifiers:
+            cbc_verifier.reset()
+    else:
+        # 2. PBC verifier setup
+        pbc_verifier = PBCVerifier()
+
+        # 3. Create CBC verifiers
+        cbc_verifiers = [CBCVerifier(_CHAIN_IDS[i])
+                         for i in range(num_child_blockchains)]
 
-    # 2. PBC verifier setup
-    pbc_verifier = PBCVerifier()
     if not silent:
         print(f"\nPBC public key: {pbc_verifier.pubkey}")
-
-    # 3. Create CBC verifiers
-    cbc_verifiers = []
-    for i in range(num_child_blockchains):
-        cbc_id = f"CBC{chr(65 + i)}"
-        cbc_verifier = CBCVerifier(cbc_id)
-        if not silent:
-            print(f"{cbc_id} public key: {cbc_verifier.pubkey}")
-        cbc_verifiers.append(cbc_verifier)
+        for cbc_verifier in cbc_verifiers:
+            print(f"{cbc_verifier.cbc_id} public key: {cbc_verifier.pubkey}")
 
     # CBC Round
     if not silent:
         print(
             f"\n--- CBC Round (Processing {num_child_blockchains} Child Blockchains) ---")
 
-    all_users_info = []  # For statistics
-
-    for i, cbc_verifier in enumerate(cbc_verifiers):
-        if not silent:
-            print(f"\n--- Processing {cbc_verifier.cbc_id} ---")
-
-        # Generate users for this CBC
-        bidder_count = bidder_counts[i]
-        users = generate_random_bidders_for_auction(
-            cbc_verifier.cbc_id, bidder_count)
-
-        # Register users in CBC
-        for user in users:
-            cbc_verifier.register_user(user)
-            all_users_info.append(user)
-
-        # Bidding phase
-        if not silent:
-            print("Bidding phase:")
-
-        for user in users:
-            # Create commitment c_i = g^{v_i} mod p (using bid value directly)
-            commitment = user.create_commitment(g, large_prime)
-
-            # Encrypt commitment
-            encrypted = user.encrypt_commitment(cbc_verifier.pubkey)
-
-            if not silent:
-                print(f"  {user.user_id}: bid=${user.bid_value}, "
-                      f"commitment=g^{user.bid_value} mod {large_prime} = {commitment}")
-
-        # CBC verifier processes
-        if not silent:
-            print("CBC verifier processing:")
-
-        # Decrypt all commitments
-        cbc_verifier.decrypt_commitments()
-
-        # Select top M winners
-        top_winners = cbc_verifier.select_top_M(M)
-        if not silent:
-            print(f"  Top {M} winners in {cbc_verifier.cbc_id}:")
-            for user, commitment in top_winners:
-                print(f"    {user.user_id}: commitment={commitment}")
-
-        # Encrypt winners for PBC
-        encrypted_winners = cbc_verifier.encrypt_winners_for_pbc(
-            pbc_verifier.pubkey)
+    # Bids are drawn here (random bid between $50-$300) so that they come
+    # from this process's RNG; each CBC is independent until the PBC round
+    cbc_bids = [rng.choices(range(50, 301), k=bidder_count)
+                for bidder_count in bidder_counts]
+    map_fn = map if executor is None else executor.map
+    for encrypted_winners in map_fn(
+            process_cbc, cbc_verifiers, cbc_bids, repeat(g),
+            repeat(commitment_table), repeat(pbc_verifier.pubkey), repeat(M),
+            repeat(silent)):
         pbc_verifier.collect_encrypted_winners(encrypted_winners)
 
     # PBC Round
@@ -321,15 +321,18 @@ def run_auction_with_generated_data(bidder_counts, num_child_blockchains, M, sil
                 f"  {i+1}. {user.user_id}: bid=${user.bid_value}, commitment={commitment}")
 
     # Generate random values and compute vector commitment
-    random_values = pbc_verifier.generate_random_values(M)
-    p = pbc_verifier.pubkey[1]  # Use n as substitute for p
-    vector_commitment = pbc_verifier.compute_vector_commitment(p)
+    vector_commitment = None
+    if compute_vc:
+        random_values = pbc_verifier.generate_random_values(M)
+        p = pbc_verifier.pubkey[1]  # Use n as substitute for p
+        vector_commitment = pbc_verifier.compute_vector_commitment(p)
 
-    if not silent:
-        print(f"\nVector Commitment:")
-        print(f"  Random values: {random_values}")
-        print(f"  Vector commitment C: {vector_commitment}")
+        if not silent:
+            print(f"\nVector Commitment:")
+            print(f"  Random values: {random_values}")
+            print(f"  Vector commitment C: {vector_commitment}")
 
+    if not silent:
         # Statistics
         print(f"\n{'='*50}")
         print("Auction Statistics:")
@@ -345,17 +348,99 @@ def run_auction_with_generated_data(bidder_counts, num_child_blockchains, M, sil
     return final_winners, vector_commitment
 
 
-# Example Usage
-if __name__ == "__main__":
-    # Start measuring total program execution time
-    total_start_time = perf_counter()
-
-    # Set the number of bidders for each ChildBlockchain individually (10 ChildBlockchains)
-    # Number of bidders in each ChildBlockchain
-    bidder_counts = [3, 5, 4, 6, 2, 7, 8, 3, 5, 4]
-    num_child_blockchains = 10  # Number of ChildBlockchains
-    M = 2  # Number of top bidders selected from each ChildBlockchain
+def _positive_int(value):
+    """argparse type for options that must be a positive integer"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be positive, got {number}")
+    return number
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description="Simple auction (test.py) vs DLP-based auction (auction.py)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python propose-test-verify.py --mode both
+  python propose-test-verify.py --mode bench --trials 100 --seed 1
+  python propose-test-verify.py --mode bench --bidders 6,6,6,6,6,6,6,6 --workers 4
+  python propose-test-verify.py --mode dlp --bidders 4,4,4 --M 1
+  python propose-test-verify.py --interactive
+        """
+    )
+
+    parser.add_argument(
+        '--mode',
+        choices=('simple', 'dlp', 'both', 'bench'),
+        default='both',
+        help='simple/dlp: run one auction with detailed output, both: run and '
+             'compare them, bench: performance test (default: both)'
+    )
+
+    parser.add_argument(
+        '--trials', '-t',
+        type=_positive_int,
+        default=10,
+        help='Number of executions in bench mode (default: 10)'
+    )
+
+    parser.add_argument(
+        '--bidders',
+        type=str,
+        default='3,5,4,6,2,7,8,3,5,4',
+        help='Comma-separated number of bidders in each CBC '
+             '(default: 3,5,4,6,2,7,8,3,5,4)'
+    )
+
+    parser.add_argument(
+        '--cbcs',
+        type=int,
+        default=None,
+        help='Number of CBCs, using the first N entries of --bidders '
+             '(default: all of them)'
+    )
+
+    parser.add_argument(
+        '--M',
+        type=_positive_int,
+        default=2,
+        help='Number of top bidders selected from each CBC (default: 2)'
+    )
+
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=0,
+        help='Worker processes for the DLP CBC rounds (default: 0, sequential)'
+    )
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed for the bid values, for identical bids across runs '
+             '(default: unseeded)'
+    )
+
+    parser.add_argument(
+        '--interactive', '-i',
+        action='store_true',
+        help='Choose the mode and number of executions from a menu'
+    )
+
+    return parser.parse_args()
+
+
+def select_interactively():
+    """Ask for the mode (and number of executions) on stdin
 
+    Returns:
+        (mode, n_trials), with n_trials None unless mode is 'bench'
+    """
     print("Please select:")
     print("1. Simple auction execution with test.py")
     print("2. Complete DLP-based auction execution with auction.py")
@@ -363,36 +448,99 @@ if __name__ == "__main__":
     print("4. Performance test (execute n times and measure average time)")
 
     choice = input("Selection (1, 2, 3, 4): ").strip()
+    modes = {"1": "simple", "2": "dlp", "3": "both", "4": "bench"}
+    if choice not in modes:
+        print("Invalid selection. Please select 1, 2, 3, or 4.")
+        return None, None
+
+    if choice != "4":
+        return modes[choice], None
+
+    print("\nPlease select number of executions:")
+    print("1. 10 times")
+    print("2. 20 times")
+    print("3. 50 times")
+    print("4. 100 times")
+    print("5. Custom number")
+
+    trials_choice = input("Selection (1, 2, 3, 4, 5): ").strip()
+
+    if trials_choice == "1":
+        n_trials = 10
+    elif trials_choice == "2":
+        n_trials = 20
+    elif trials_choice == "3":
+        n_trials = 50
+    elif trials_choice == "4":
+        n_trials = 100
+    elif trials_choice == "5":
+        try:
+            n_trials = _positive_int(input("Enter number of executions: "))
+        except argparse.ArgumentTypeError as e:
+            print(f"Invalid number of executions: {e}")
+            return None, None
+    else:
+        print("Invalid selection. Executing with default value of 10 times.")
+        n_trials = 10
+
+    return "bench", n_trials
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+
+    # Start measuring total program execution time
+    total_start_time = perf_counter_ns()
 
-    if choice == "4":
+    # Number of bidders in each ChildBlockchain
+    try:
+        bidder_counts = [int(x.strip()) for x in args.bidders.split(',')]
+    except ValueError:
+        print("Error: Invalid bidder counts format. Use comma-separated integers (e.g., 3,5,4)")
+        sys.exit(1)
+    # Number of ChildBlockchains
+    num_child_blockchains = args.cbcs if args.cbcs is not None else len(bidder_counts)
+    M = args.M  # Number of top bidders selected from each ChildBlockchain
+
+    if not 0 < num_child_blockchains <= min(len(bidder_counts), len(_CHAIN_IDS)):
+        print(f"Error: Number of CBCs must be between 1 and "
+              f"{min(len(bidder_counts), len(_CHAIN_IDS))}")
+        sys.exit(1)
+    if any(count <= 0 for count in bidder_counts):
+        print("Error: Bidder counts must be positive")
+        sys.exit(1)
+    if args.workers < 0:
+        print("Error: Number of workers must not be negative")
+        sys.exit(1)
+    bidder_counts = bidder_counts[:num_child_blockchains]
+
+    # All bids are drawn from one generator, seeded if requested. With a
+    # seed, the DLP auction gets its own generator with the same seed, so in
+    # 'both' mode the two auctions see the same bids and their winners can
+    # be compared
+    rng = random.Random(args.seed) if args.seed is not None else random
+    dlp_rng = random.Random(args.seed) if args.seed is not None else random
+
+    if args.interactive:
+        mode, n_trials = select_interactively()
+    else:
+        mode, n_trials = args.mode, args.trials
+
+    # Worker processes are reseeded so they do not share the parent's RNG state
+    # (the bids themselves are always drawn in this process)
+    executor = None
+    if args.workers > 0:
+        executor = ProcessPoolExecutor(
+            max_workers=args.workers, initializer=random.seed)
+
+    if mode == "bench":
         # Performance test
-        print("\nPlease select number of executions:")
-        print("1. 10 times")
-        print("2. 20 times")
-        print("3. 50 times")
-        print("4. 100 times")
-        print("5. Custom number")
-
-        trials_choice = input("Selection (1, 2, 3, 4, 5): ").strip()
-
-        if trials_choice == "1":
-            n_trials = 10
-        elif trials_choice == "2":
-            n_trials = 20
-        elif trials_choice == "3":
-            n_trials = 50
-        elif trials_choice == "4":
-            n_trials = 100
-        elif trials_choice == "5":
-            n_trials = int(input("Enter number of executions: "))
-        else:
-            print("Invalid selection. Executing with default value of 10 times.")
-            n_trials = 10
-
-        run_performance_test(bidder_counts, num_child_blockchains, M, n_trials)
-    elif choice == "1" or choice == "3":
-        # Measure execution time for selections 1 and 3 individually
-        section_start_time = perf_counter()
+        run_performance_test(bidder_counts, num_child_blockchains, M, n_trials,
+                             executor=executor, rng=rng)
+
+    if mode in ("simple", "both"):
+        # Measure execution time for the simple and both modes individually
+        section_start_time = perf_counter_ns()
 
         print("\n" + "="*60)
         print("TEST.PY SIMPLE AUCTION")
@@ -402,11 +550,11 @@ if __name__ == "__main__":
         child_blockchains = []
 
         for i in range(num_child_blockchains):
-            chain_id = f"CBC{chr(65 + i)}"
+            chain_id = _CHAIN_IDS[i]
             bidder_count = bidder_counts[i]
 
             # Generate random bidders
-            bidders = generate_random_bidders(chain_id, bidder_count)
+            bidders = generate_random_bidders(chain_id, bidder_count, rng)
             child_blockchain = ChildBlockchain(chain_id, bidders, M=M)
             child_blockchains.append(child_blockchain)
 
@@ -436,19 +584,19 @@ if __name__ == "__main__":
         print(f"{'='*50}")
         for i, winner in enumerate(global_winners):
             print(
-                f"{i+1}. {winner.id} (Bid: ${winner.bid_value}, Commitment: {winner.commitment})")
+                f"{i+1}. {winner.id} (Bid: ${winner.bid_value})")
 
-        simple_execution_time = perf_counter() - section_start_time
+        simple_execution_ns = perf_counter_ns() - section_start_time
         print(f"\n{'='*50}")
         print(
-            f"Simple Auction Execution Time: {simple_execution_time:.6f} seconds ({simple_execution_time*1000:.3f} ms)")
+            f"Simple Auction Execution Time: {simple_execution_ns / 1e9:.6f} seconds ({simple_execution_ns / 1e6:.3f} ms)")
         print(f"{'='*50}")
 
-    elif choice == "2" or choice == "3":
-        # Measure execution time for selections 2 and 3 individually
-        section_start_time = perf_counter()
+    if mode in ("dlp", "both"):
+        # Measure execution time for the dlp and both modes individually
+        section_start_time = perf_counter_ns()
 
-        if choice == "3":
+        if mode == "both":
             print("\n\n")
 
         print("="*60)
@@ -457,26 +605,33 @@ if __name__ == "__main__":
 
         # Complete DLP-based auction using auction.py
         final_winners, vector_commitment = run_auction_with_generated_data(
-            bidder_counts, num_child_blockchains, M
+            bidder_counts, num_child_blockchains, M, executor=executor, rng=dlp_rng
         )
 
         print("\n" + "=" * 60)
         print("DLP-based Auction Complete!")
         print("=" * 60)
 
-        dlp_execution_time = perf_counter() - section_start_time
+        dlp_execution_ns = perf_counter_ns() - section_start_time
         print(
-            f"\nDLP Auction Execution Time: {dlp_execution_time:.6f} seconds ({dlp_execution_time*1000:.3f} ms)")
+            f"\nDLP Auction Execution Time: {dlp_execution_ns / 1e9:.6f} seconds ({dlp_execution_ns / 1e6:.3f} ms)")
         print("=" * 60)
-    else:
-        print("Invalid selection. Please select 1, 2, 3, or 4.")
+
+        if mode == "both" and args.seed is not None:
+            simple_bids = [winner.bid_value for winner in global_winners]
+            dlp_bids = [user.bid_value for user, _ in final_winners]
+            print(f"\nWinning bids - Simple: {simple_bids}, DLP: {dlp_bids}")
+            print(f"Winners match: {simple_bids == dlp_bids}")
+
+    if executor is not None:
+        executor.shutdown()
 
     # Display total program execution time
-    total_execution_time = perf_counter() - total_start_time
+    total_execution_ns = perf_counter_ns() - total_start_time
     print(f"\n{'='*60}")
     print(f"TOTAL PROGRAM EXECUTION TIME")
     print(f"{'='*60}")
     print(
-        f"Total time: {total_execution_time:.6f} seconds ({total_execution_time*1000:.3f} ms)")
+        f"Total time: {total_execution_ns / 1e9:.6f} seconds ({total_execution_ns / 1e6:.3f} ms)")
     print(f"Program finished successfully!")
     print(f"{'='*60}")